@@ -1,2 +1,2 @@
 from .enums import IntegerChoicesEnum, TextChoicesEnum, Choice
-from .fields import CharEnumField, CharEnumSubField, IntegerEnumField, IntegerEnumSubField
+from .fields import CharEnumField, CharEnumSubField, EnumSetField, IntegerEnumField, IntegerEnumSubField
@@ -1,6 +1,16 @@
+import hashlib
+
+import django
 from django.contrib.admin.filters import ChoicesFieldListFilter
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
 
+if django.VERSION >= (5, 0):
+    from django.contrib.admin.utils import build_q_object_from_lookup_parameters
+
 
 class EnumFieldListFilter(ChoicesFieldListFilter):
 
@@ -30,3 +40,134 @@ class EnumFieldListFilter(ChoicesFieldListFilter):
                     self.used_parameters[self.lookup_kwarg] = enum_value
                     break
         return super().queryset(request, queryset)
+
+
+class EnumFieldCountListFilter(EnumFieldListFilter):
+    """
+    List filter which shows number of rows next to every enum member and hides members without rows.
+
+    Counts are computed by one grouped query over the changelist queryset without the filter's own
+    selection. Set `count_cache_timeout` (in seconds) to cache the counts for very large tables.
+    """
+
+    count_cache_timeout = None
+    count_cache_key_prefix = 'enumfields:list_filter_counts'
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.request = request
+        super().__init__(field, request, params, model, model_admin, field_path)
+
+    def get_count_queryset(self, cl):
+        """
+        Return the changelist queryset without the filter's own selection and whether it may have duplicates.
+        Mirrors `ChangeList.get_queryset`.
+        """
+        _, _, remaining_lookup_params, filters_may_have_duplicates, _ = cl.get_filters(self.request)
+        queryset = cl.root_queryset
+        for filter_spec in cl.filter_specs:
+            if filter_spec is not self:
+                new_queryset = filter_spec.queryset(self.request, queryset)
+                if new_queryset is not None:
+                    queryset = new_queryset
+        if django.VERSION >= (5, 0):
+            queryset = queryset.filter(build_q_object_from_lookup_parameters(remaining_lookup_params))
+        else:
+            queryset = queryset.filter(**remaining_lookup_params)
+        queryset, search_may_have_duplicates = cl.model_admin.get_search_results(self.request, queryset, cl.query)
+        return queryset, filters_may_have_duplicates or search_may_have_duplicates
+
+    def _get_counts(self, queryset, distinct):
+        rows = queryset.order_by().values_list(self.field_path).annotate(enum_count=Count('pk', distinct=distinct))
+        return {getattr(value, 'value', value): count for value, count in rows}
+
+    def get_counts(self, cl):
+        queryset, may_have_duplicates = self.get_count_queryset(cl)
+        if self.count_cache_timeout is None:
+            return self._get_counts(queryset, may_have_duplicates)
+
+        try:
+            sql = str(queryset.query)
+        except EmptyResultSet:
+            return {}
+        cache_key = '{}:{}:{}:{}:{}'.format(
+            self.count_cache_key_prefix, queryset.model._meta.label_lower, queryset.db, self.field_path,
+            hashlib.md5('{}:{}'.format(may_have_duplicates, sql).encode('utf-8')).hexdigest(),
+        )
+        counts = cache.get(cache_key)
+        if counts is None:
+            counts = self._get_counts(queryset, may_have_duplicates)
+            cache.set(cache_key, counts, self.count_cache_timeout)
+        return counts
+
+    def choices(self, cl):
+        counts = self.get_counts(cl)
+        yield {
+            'selected': self.lookup_val is None,
+            'query_string': cl.get_query_string({}, [self.lookup_kwarg]),
+            'display': _('All'),
+        }
+        for enum_value in self.field.enum:
+            str_value = str(enum_value.value)
+            count = counts.get(enum_value.value, 0)
+            if not count and str_value != self.lookup_val:
+                continue
+            yield {
+                'selected': (str_value == self.lookup_val),
+                'query_string': cl.get_query_string({self.lookup_kwarg: enum_value}),
+                'display': '{} ({})'.format(getattr(enum_value, 'label', None) or str(enum_value), count),
+            }
+
+
+class EnumFieldMultipleListFilter(EnumFieldListFilter):
+    """
+    List filter which allows to select several enum members at once, e.g. `?color__in=r,b`.
+
+    Selected values are converted to members in one batch and filtered with a single `__in` lookup.
+    """
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.lookup_kwarg_in = '%s__in' % field_path
+        super().__init__(field, request, params, model, model_admin, field_path)
+        self.lookup_vals = self.used_parameters.get(self.lookup_kwarg_in, [])
+
+    def expected_parameters(self):
+        return [self.lookup_kwarg_in] + super().expected_parameters()
+
+    def get_query_string_values(self, values):
+        values = set(values)
+        return ','.join(str(enum_value.value) for enum_value in self.field.enum if str(enum_value.value) in values)
+
+    def choices(self, cl):
+        yield {
+            'selected': not self.lookup_vals and self.lookup_val is None,
+            'query_string': cl.get_query_string({}, [self.lookup_kwarg_in, self.lookup_kwarg]),
+            'display': _('All'),
+        }
+        for enum_value in self.field.enum:
+            str_value = str(enum_value.value)
+            selected = str_value in self.lookup_vals
+            if selected:
+                values = [value for value in self.lookup_vals if value != str_value]
+            else:
+                values = self.lookup_vals + [str_value]
+
+            if values:
+                query_string = cl.get_query_string(
+                    {self.lookup_kwarg_in: self.get_query_string_values(values)}, [self.lookup_kwarg]
+                )
+            else:
+                query_string = cl.get_query_string({}, [self.lookup_kwarg_in, self.lookup_kwarg])
+            yield {
+                'selected': selected,
+                'query_string': query_string,
+                'display': getattr(enum_value, 'label', None) or str(enum_value),
+            }
+
+    def queryset(self, request, queryset):
+        if self.lookup_vals:
+            str_value_map = self.field.enum.str_value_map
+            try:
+                self.used_parameters[self.lookup_kwarg_in] = [str_value_map[value] for value in self.lookup_vals]
+            except KeyError as ex:
+                raise IncorrectLookupParameters(ex)
+        return super().queryset(request, queryset)
@@ -0,0 +1,23 @@
+from django.db.migrations.autodetector import MigrationAutodetector
+
+from .fields import EnumFieldMixin, EnumSetField, enum_fingerprint
+
+try:
+    from .postgres import EnumArrayField
+except ImportError:  # psycopg isn't installed
+    ENUM_FIELD_CLASSES = (EnumFieldMixin, EnumSetField)
+else:
+    ENUM_FIELD_CLASSES = (EnumFieldMixin, EnumSetField, EnumArrayField)
+
+
+class EnumMigrationAutodetector(MigrationAutodetector):
+    """
+    Migration autodetector which compares enums of fields by their fingerprints. Changes of labels, `next`,
+    `initial`, extra choice attributes or order of members don't generate `AlterField` operations.
+    """
+
+    def deep_deconstruct(self, obj):
+        deconstructed = super().deep_deconstruct(obj)
+        if isinstance(obj, ENUM_FIELD_CLASSES) and 'enum' in deconstructed[2]:
+            deconstructed[2]['enum'] = enum_fingerprint(obj.enum)
+        return deconstructed
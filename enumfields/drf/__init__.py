@@ -1,2 +1,2 @@
-from .fields import EnumField
+from .fields import EnumField, EnumMultipleField
 from .serializers import EnumSupportSerializerMixin
@@ -1,4 +1,71 @@
-from rest_framework.fields import ChoiceField
+from functools import lru_cache
+from types import MappingProxyType
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import ChoiceField, MultipleChoiceField, flatten_choices_dict, to_choices_dict
+
+
+@lru_cache(maxsize=None)
+def get_enum_choices(enum):
+    """
+    Return read-only choice structures of the enum shared by all serializer fields: choices tuple,
+    grouped choices, flat choices and the map of choice strings to values used by `ChoiceField`.
+    """
+    choices = tuple((e.value, getattr(e, 'label', e.name)) for e in enum)
+    grouped_choices = to_choices_dict(choices)
+    flat_choices = flatten_choices_dict(grouped_choices)
+    choice_strings_to_values = {str(key): key for key in flat_choices}
+    return (
+        choices,
+        MappingProxyType(grouped_choices),
+        MappingProxyType(flat_choices),
+        MappingProxyType(choice_strings_to_values),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_member_index(enum):
+    """
+    Return read-only map of string representations of member values to members.
+    """
+    return MappingProxyType({str(choice.value): choice for choice in enum})
+
+
+@lru_cache(maxsize=None)
+def get_member_bits(enum):
+    """
+    Return read-only map of enum members to bit positions given by the declaration order.
+    """
+    return MappingProxyType({choice: bit for bit, choice in enumerate(enum)})
+
+
+@lru_cache(maxsize=None)
+def get_representation_map(enum, ints_as_names):
+    """
+    Return read-only map of enum members to their serialized representation for the given field configuration.
+    """
+    return MappingProxyType({
+        choice: choice.name.lower() if ints_as_names and isinstance(choice.value, int) else choice.value
+        for choice in enum
+    })
+
+
+@lru_cache(maxsize=None)
+def get_lenient_index(enum):
+    """
+    Return pair of read-only indexes used for lenient parsing of the enum. The first one maps exact member names
+    and values, the second one casefolded names and string values. Indexes are built once per enum class and
+    members declared earlier take precedence.
+    """
+    exact_index, casefolded_index = {}, {}
+    for choice in reversed(list(enum)):
+        exact_index[choice.name] = choice
+        exact_index[choice.value] = choice
+    for choice in reversed(list(enum)):
+        casefolded_index[choice.name.casefold()] = choice
+        casefolded_index[str(choice.value).casefold()] = choice
+    return MappingProxyType(exact_index), MappingProxyType(casefolded_index)
 
 
 class EnumField(ChoiceField):
@@ -13,10 +80,28 @@ class EnumField(ChoiceField):
         self.enum = enum
         self.lenient = lenient
         self.ints_as_names = ints_as_names
-        kwargs['choices'] = tuple((e.value, getattr(e, 'label', e.name)) for e in self.enum)
+        kwargs['choices'] = get_enum_choices(self.enum)[0]
         super(EnumField, self).__init__(**kwargs)
+        self.representation_map = get_representation_map(self.enum, self.ints_as_names)
+
+    def _set_choices(self, choices):
+        enum_choices, grouped_choices, flat_choices, choice_strings_to_values = get_enum_choices(self.enum)
+        if choices is enum_choices:
+            # Fields are instantiated again for every serializer instance, reuse the structures of the enum.
+            self.grouped_choices = grouped_choices
+            self._choices = flat_choices
+            self.choice_strings_to_values = choice_strings_to_values
+        else:
+            super()._set_choices(choices)
+
+    choices = property(ChoiceField._get_choices, _set_choices)
 
     def to_representation(self, instance):
+        try:
+            return self.representation_map[instance]
+        except (KeyError, TypeError):
+            pass
+
         if instance in ('', u'', None):
             return instance
         try:
@@ -29,27 +114,116 @@ class EnumField(ChoiceField):
         except ValueError:
             raise ValueError('Invalid value [%r] of enum %s' % (instance, self.enum.__name__))
 
-    def to_internal_value(self, data):
+    def to_representation_many(self, instances):
+        """
+        Bulk counterpart of `to_representation` for code serializing columns of values.
+        """
+        representation_map = self.representation_map
+        to_representation = self.to_representation
+        return [
+            representation_map[instance] if instance in representation_map else to_representation(instance)
+            for instance in instances
+        ]
+
+    def resolve_member(self, data):
+        """
+        Return enum member for the input data or None if the data doesn't match any member.
+        """
         if isinstance(data, self.enum):
             return data
         try:
             # Convert the value using the same mechanism DRF uses
-            converted_value = self.choice_strings_to_values[str(data)]
-            return self.enum(converted_value)
-        except (ValueError, KeyError):
+            return get_member_index(self.enum)[str(data)]
+        except KeyError:
             pass
 
         if self.lenient:
+            exact_index, casefolded_index = get_lenient_index(self.enum)
             # Normal logic:
-            for choice in self.enum:
-                if choice.name == data or choice.value == data:
-                    return choice
+            try:
+                return exact_index[data]
+            except (KeyError, TypeError):
+                pass
 
             # Case-insensitive logic:
-            l_data = str(data).lower()
-            for choice in self.enum:
-                if choice.name.lower() == l_data or str(choice.value).lower() == l_data:
-                    return choice
+            try:
+                return casefolded_index[str(data).casefold()]
+            except KeyError:
+                pass
+        return None
+
+    def to_internal_value(self, data):
+        member = self.resolve_member(data)
+        if member is not None:
+            return member
 
         # Fallback (will likely just raise):
         return super(EnumField, self).to_internal_value(data)
+
+
+class EnumMultipleField(EnumField):
+    """
+    Serializer field for lists of enum members. The whole list is validated in one pass, duplicates are removed
+    and errors are reported per index of the invalid items.
+    """
+
+    OUTPUT_LIST = 'list'
+    OUTPUT_FROZENSET = 'frozenset'
+    OUTPUT_BITMASK = 'bitmask'
+
+    default_error_messages = {
+        'not_a_list': _('Expected a list of items but got type "{input_type}".'),
+        'empty': _('This selection may not be empty.'),
+    }
+    default_empty_html = []
+
+    def __init__(self, enum, output=OUTPUT_LIST, allow_empty=True, bits=None, **kwargs):
+        """
+        :param output: Type of the validated data, one of `list`, `frozenset` or `bitmask`
+        :type output: str
+        :param allow_empty: Whether to allow empty list
+        :type allow_empty: bool
+        :param bits: Map of enum members to bit positions used for `bitmask` output, defaults to declaration order
+        :type bits: dict
+        """
+        assert output in (self.OUTPUT_LIST, self.OUTPUT_FROZENSET, self.OUTPUT_BITMASK), (
+            'Invalid output type {}'.format(output)
+        )
+        self.output = output
+        self.allow_empty = allow_empty
+        self.bits = bits if bits is not None else get_member_bits(enum)
+        super().__init__(enum, **kwargs)
+
+    get_value = MultipleChoiceField.get_value
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        members = {}
+        errors = {}
+        resolve_member = self.resolve_member
+        for index, item in enumerate(data):
+            member = resolve_member(item)
+            if member is None:
+                errors[index] = [self.error_messages['invalid_choice'].format(input=item)]
+            else:
+                members[member] = None
+        if errors:
+            raise ValidationError(errors)
+
+        if self.output == self.OUTPUT_FROZENSET:
+            return frozenset(members)
+        elif self.output == self.OUTPUT_BITMASK:
+            bits = self.bits
+            return sum(1 << bits[member] for member in members)
+        else:
+            return list(members)
+
+    def to_representation(self, value):
+        if isinstance(value, int):
+            value = [member for member, bit in self.bits.items() if value & (1 << bit)]
+        to_representation = super().to_representation
+        return [to_representation(member) for member in dict.fromkeys(value)]
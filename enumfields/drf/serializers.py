@@ -1,8 +1,9 @@
 from typing import Any
+
 from rest_framework.fields import ChoiceField
 
-from enumfields.drf.fields import EnumField as EnumSerializerField
-from enumfields.fields import EnumFieldMixin
+from enumfields.drf.fields import EnumField as EnumSerializerField, EnumMultipleField
+from enumfields.fields import EnumFieldMixin, EnumSetField
 
 
 class EnumSupportSerializerMixin(object):
@@ -16,4 +17,12 @@ class EnumSupportSerializerMixin(object):
             field_class = EnumSerializerField
             field_kwargs['enum'] = model_field.enum
             field_kwargs.update(self.enumfield_options)
+        elif isinstance(model_field, EnumSetField):
+            field_class = EnumMultipleField
+            for key in ('max_value', 'min_value', 'validators'):
+                field_kwargs.pop(key, None)
+            field_kwargs['enum'] = model_field.enum
+            field_kwargs['output'] = EnumMultipleField.OUTPUT_FROZENSET
+            field_kwargs['bits'] = model_field.member_bits
+            field_kwargs.update(self.enumfield_options)
         return field_class, field_kwargs
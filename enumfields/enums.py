@@ -1,7 +1,12 @@
 import enum
+import sys
+from types import MappingProxyType
 from typing import Any
 
+from django.core.signals import setting_changed
+from django.utils.autoreload import file_changed
 from django.utils.functional import Promise
+from django.utils.translation import get_language
 
 
 class Choice:
@@ -14,13 +19,95 @@ class Choice:
         self.extra = kwargs
 
 
+def freeze_value(value):
+    """
+    Return immutable counterpart of the choice metadata value.
+    """
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    elif isinstance(value, list):
+        return tuple(value)
+    elif isinstance(value, dict):
+        return MappingProxyType({k: freeze_value(v) for k, v in value.items()})
+    else:
+        return value
+
+
+def import_enum(module, qualname):
+    """
+    Return enum class importable by its module and qualified name, or None.
+    """
+    obj = sys.modules.get(module)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name, None)
+    return obj
+
+
+def get_definition_key(definition):
+    """
+    Return hashable form of the deconstructed enum definition.
+    """
+    if isinstance(definition, dict):
+        return tuple(sorted((key, get_definition_key(value)) for key, value in definition.items()))
+    elif isinstance(definition, (set, frozenset)):
+        return frozenset(definition)
+    elif isinstance(definition, (list, tuple)):
+        return tuple(get_definition_key(value) for value in definition)
+    return definition
+
+
+# Enums which can't be imported by reference, e.g. created dynamically in migrations, keyed by their definitions.
+DYNAMIC_ENUMS = {}
+
+
+def restore_member(definition, value):
+    """
+    Restore member of an enum which can't be imported by reference pickled by `ChoicesEnum.__reduce_ex__`.
+    """
+    key = get_definition_key(definition)
+    cls = DYNAMIC_ENUMS.get(key)
+    if cls is None:
+        from .fields import construct_enum
+
+        cls = DYNAMIC_ENUMS.setdefault(key, construct_enum(definition))
+    return cls(value)
+
+
+# Labels of enums with lazily translated labels resolved per active language, keyed by (enum class, language).
+LABEL_CACHE = {}
+
+
+def clear_label_cache(**kwargs):
+    LABEL_CACHE.clear()
+
+
+def translation_setting_changed(setting, **kwargs):
+    if setting in {'LANGUAGES', 'LANGUAGE_CODE', 'LOCALE_PATHS'}:
+        clear_label_cache()
+
+
+def translation_file_changed(file_path, **kwargs):
+    if file_path.suffix == '.mo':
+        clear_label_cache()
+
+
+setting_changed.connect(translation_setting_changed, dispatch_uid='enumfields_translation_setting_changed')
+file_changed.connect(translation_file_changed, dispatch_uid='enumfields_translation_file_changed')
+
+
 def set_enum_attribute(enum, name, value_map):
     setattr(enum, name, property(lambda self: value_map[self.value].get(name)))
 
 
 class ChoiceEnumMeta(enum.EnumMeta):
-
-    def __new__(metacls, classname, bases, classdict, **kwds):
+    """
+    Metaclass of choice enums. All member metadata (`label`, `next`, `initial` and extra `Choice` keywords)
+    are frozen when the class is created, therefore they can be read from multiple threads without locking.
+    """
+
+    def __new__(metacls, classname, bases, classdict, _extra_data=None, **kwds):
+        if _extra_data is not None:
+            return metacls._create_from_extra_data(classname, bases, classdict, _extra_data, **kwds)
         extra_keys = {'next', 'initial'}
         extra_data = []
 
@@ -77,10 +164,34 @@ class ChoiceEnumMeta(enum.EnumMeta):
             # assignment in enum's classdict.
             dict.__setitem__(classdict, key, value)
         cls = super().__new__(metacls, classname, bases, classdict, **kwds)
-        cls._value2data_map_ = dict(zip(cls._value2member_map_, extra_data))
+        cls._init_extra_data(extra_keys, extra_data)
+        cls = enum.unique(cls)
+        return cls
+
+    @classmethod
+    def _create_from_extra_data(metacls, classname, bases, classdict, extra_data, **kwds):
+        """
+        Create enum from classdict with plain member values and already frozen metadata of members.
+        """
+        cls = super().__new__(metacls, classname, bases, classdict, **kwds)
+        extra_keys = {'next', 'initial', 'label'}
+        for data in extra_data:
+            if len(data) > 3:
+                extra_keys.update(data.keys())
+        cls._init_extra_data(extra_keys, extra_data, frozen=True)
+        if len(cls._member_names_) != len(extra_data):
+            # Some values are duplicated, let `enum.unique` report the aliases.
+            enum.unique(cls)
+        return cls
+
+    def _init_extra_data(cls, extra_keys, extra_data, frozen=False):
+        if not frozen:
+            extra_data = [MappingProxyType({key: freeze_value(v) for key, v in data.items()}) for data in extra_data]
+        cls._value2data_map_ = MappingProxyType(dict(zip(cls._value2member_map_, extra_data)))
         for key in extra_keys:
             set_enum_attribute(cls, key, cls._value2data_map_)
-        return enum.unique(cls)
+        cls._choice_attributes_ = frozenset(extra_keys)
+        cls._has_lazy_labels_ = any(isinstance(data['label'], Promise) for data in extra_data)
 
     def __contains__(cls, member):
         if not isinstance(member, enum.Enum):
@@ -88,6 +199,71 @@ class ChoiceEnumMeta(enum.EnumMeta):
             return any(x.value == member for x in cls)
         return super().__contains__(member)
 
+    @property
+    def str_value_map(cls):
+        """
+        Mapping of string representations of member values to members. It is built only once per enum.
+        """
+        if '_str_value2member_map_' not in cls.__dict__:
+            # Concurrent first access can only build the same map twice, the map is read-only afterwards.
+            cls._str_value2member_map_ = MappingProxyType({str(member.value): member for member in cls})
+        return cls._str_value2member_map_
+
+    def get_attribute_index(cls, attribute):
+        """
+        Return inverted index of the choice attribute mapping its values to tuples of members. Members with tuple
+        or frozenset values are indexed by every item as well. Indexes are built lazily once per attribute.
+        Raises ValueError when no member defines the attribute.
+        """
+        if attribute not in cls._choice_attributes_:
+            raise ValueError('Members of {} have no choice attribute {!r}'.format(cls.__name__, attribute))
+        if '_attribute_indexes_' not in cls.__dict__:
+            cls._attribute_indexes_ = {}
+        if attribute not in cls._attribute_indexes_:
+            index = {}
+            for member in cls:
+                value = cls._value2data_map_[member._value_].get(attribute)
+                keys = [value]
+                if isinstance(value, (tuple, frozenset)):
+                    keys.extend(value)
+                for key in dict.fromkeys(keys):
+                    index.setdefault(key, []).append(member)
+            cls._attribute_indexes_[attribute] = MappingProxyType({k: tuple(v) for k, v in index.items()})
+        return cls._attribute_indexes_[attribute]
+
+    def members_where(cls, **conditions):
+        """
+        Return tuple of members whose choice attributes match all conditions, e.g. `Enum.members_where(group='x')`.
+        """
+        members = None
+        for attribute, value in conditions.items():
+            matched = cls.get_attribute_index(attribute).get(value, ())
+            members = matched if members is None else tuple(m for m in members if m in matched)
+        return members if members is not None else tuple(cls)
+
+    def get_localized(cls):
+        """
+        Return mapping of members to labels and list of choices resolved in the active language. Both are cached
+        per language until translations are reloaded.
+        """
+        key = (cls, get_language())
+        # Single read of the cache, it can be cleared concurrently when translations are reloaded
+        localized = LABEL_CACHE.get(key)
+        if localized is None:
+            labels = MappingProxyType({member: str(member.label) for member in cls})
+            empty = ((None, str(cls.__empty__)),) if hasattr(cls, '__empty__') else ()
+            localized = labels, empty + tuple((member.value, label) for member, label in labels.items())
+            LABEL_CACHE[key] = localized
+        return localized
+
+    @property
+    def localized_choices(cls):
+        return list(cls.get_localized()[1])
+
+    @property
+    def localized_labels(cls):
+        return [label for _, label in cls.get_localized()[1]]
+
     @property
     def names(cls):
         empty = ['__empty__'] if hasattr(cls, '__empty__') else []
@@ -118,7 +294,26 @@ class ChoicesEnum(enum.Enum, metaclass=ChoiceEnumMeta):
     value: Any
     label: str
     initial: bool
-    next: set[str] | None
+    next: frozenset[str] | None
+
+    def __reduce_ex__(self, proto):
+        """
+        Members of enums which can be imported by reference are pickled by value as usual. Members of other enums,
+        e.g. created dynamically in migrations, are pickled with the deconstructed enum definition, which is
+        constructed once per process when unpickled.
+        """
+        cls = self.__class__
+        if '_pickle_definition_' not in cls.__dict__:
+            definition = None
+            if import_enum(cls.__module__, cls.__qualname__) is not cls:
+                name, enum_base, enum_type, choices = cls.deconstruct_cls()
+                if choices is not None:
+                    definition = {'name': name, 'base': enum_base, 'type': enum_type, 'choices': choices}
+                    DYNAMIC_ENUMS.setdefault(get_definition_key(definition), cls)
+            cls._pickle_definition_ = definition
+        if cls._pickle_definition_ is None:
+            return super().__reduce_ex__(proto)
+        return restore_member, (cls._pickle_definition_, self._value_)
 
     def deconstruct_choice(self):
         keywords = {'value': self.value}
@@ -139,10 +334,34 @@ class ChoicesEnum(enum.Enum, metaclass=ChoiceEnumMeta):
             enum_type, enum_base = [class_to_str(base) for base in cls.__bases__]
         return name, enum_base, enum_type, dict(choice.deconstruct_choice() for choice in cls)
 
+    @classmethod
+    def from_records(cls, name, records, module=None, qualname=None):
+        """
+        Create enum with members built from `(name, value)`, `(name, value, label)` or
+        `(name, value, label, extra)` records in one pass, e.g. for enums generated from data files.
+        """
+        metacls = cls.__class__
+        classdict = metacls.__prepare__(name, (cls,))
+        classdict['__module__'] = module or sys._getframe(1).f_globals['__name__']
+        classdict['__qualname__'] = qualname or name
+        extra_data = []
+        for record in records:
+            member_name, value, *rest = record
+            label = rest[0] if rest and rest[0] is not None else member_name.replace('_', ' ').title()
+            data = {'next': None, 'initial': True, 'label': label}
+            if len(rest) > 1:
+                data.update({key: freeze_value(v) for key, v in rest[1].items()})
+            classdict[member_name] = value
+            extra_data.append(MappingProxyType(data))
+        return metacls(name, (cls,), classdict, _extra_data=extra_data)
+
     def __str__(self):
         """
         Show our label when Django uses the Enum for displaying in a view
         """
+        cls = self.__class__
+        if cls._has_lazy_labels_:
+            return cls.get_localized()[0][self]
         return str(self.label)
 
 
@@ -1,16 +1,25 @@
+import copy
+import datetime
+import hashlib
+from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
+from uuid import UUID
 
 import django
+from django.core import checks
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Lookup
+from django.db.models.lookups import In
 from django.db.models.fields import BLANK_CHOICE_DASH
 from django.db.models.signals import post_save
-from django.utils.functional import cached_property
+from django.utils.functional import Promise, cached_property
 from django.utils.module_loading import import_string
-from django.utils.translation import gettext
+from django.utils.translation import get_language, gettext
 
 from .enums import ChoicesEnum, Choice
-from .forms import EnumChoiceField
+from .forms import EnumChoiceField, EnumMultipleChoiceField
 
 
 class CastOnAssignDescriptor:
@@ -100,8 +109,183 @@ def construct_enum(enum):
         return enum
 
 
+def _prepare_transition(instance, field_name, value):
+    field = instance._meta.get_field(field_name)
+    value = field.to_python(value)
+    field._validate_next_value(value, instance)
+    setattr(instance, field_name, value)
+    return value
+
+
+def transition(instance, field_name, value, save=True):
+    """
+    Validate transition of enum field `field_name` to `value` against the `next` choices of the initial value,
+    assign it and save only the field. Raises ValidationError for transitions which are not allowed.
+    """
+    value = _prepare_transition(instance, field_name, value)
+    if save:
+        instance.save(update_fields=[field_name])
+    return value
+
+
+async def atransition(instance, field_name, value, save=True):
+    """
+    Async counterpart of `transition`. The transition is validated without leaving the event loop,
+    only the save itself is executed via `Model.asave`.
+    """
+    value = _prepare_transition(instance, field_name, value)
+    if save:
+        await instance.asave(update_fields=[field_name])
+    return value
+
+
+class EnumMetaLookup(In):
+    """
+    Lookup filtering by choice attributes, e.g. `state__meta_group='x'` is compiled to `state IN (...)`
+    with values of members returned by `members_where(group='x')`.
+    """
+
+    prefix = 'meta_'
+    attribute = None
+
+    def __init__(self, lhs, rhs):
+        members = lhs.output_field.enum.members_where(**{self.attribute: rhs})
+        super().__init__(lhs, [member.value for member in members])
+
+
+@lru_cache(maxsize=None)
+def get_enum_meta_lookup(lookup_name):
+    return type('EnumMetaLookup', (EnumMetaLookup,), {
+        'lookup_name': lookup_name,
+        'attribute': lookup_name[len(EnumMetaLookup.prefix):],
+    })
+
+
+def enum_fingerprint(enum):
+    """
+    Return deterministic and order-insensitive fingerprint of the enum values, i.e. of the part of the enum which
+    is stored in the database. Labels, names and other choice attributes don't change the fingerprint.
+    """
+    enum = construct_enum(enum)
+    values = sorted('{}:{!r}'.format(type(choice.value).__name__, choice.value) for choice in enum)
+    return hashlib.sha256('\n'.join(values).encode('utf-8')).hexdigest()[:16]
+
+
+class EnumTransitionConflict(Exception):
+    """
+    Raised when the enum field was changed in the database by someone else during `transition_to`.
+    """
+
+
+def transition_to(instance, field_name, value):
+    """
+    Optimistic compare-and-swap transition of enum field without row locks. The transition is validated against
+    the `next` choices of the initial value and saved with `UPDATE ... SET field = value WHERE pk = ? AND field =
+    initial`. Raises EnumTransitionConflict if the row no longer contains the initial value. Signals are not sent.
+    """
+    field = instance._meta.get_field(field_name)
+    value = field.to_python(value)
+    field._validate_next_value(value, instance)
+
+    initial_field_name = field.get_initial_cache_name()
+    initial_value = instance.__dict__.get(initial_field_name)
+    updated = instance.__class__._base_manager.using(instance._state.db).filter(
+        pk=instance.pk, **{field.attname: initial_value}
+    ).update(**{field.attname: value})
+    if not updated:
+        raise EnumTransitionConflict(
+            'Value of {} was changed from "{}" by a concurrent update'.format(
+                field_name, getattr(initial_value, 'name', initial_value)
+            )
+        )
+    instance.__dict__[field.name] = value
+    instance.__dict__[initial_field_name] = value
+    return value
+
+
+def get_dirty_enum_fields(instance):
+    """
+    Return names of enum fields whose values differ from values loaded from or last saved to the database.
+    """
+    return [
+        field.name for field in instance._meta.concrete_fields
+        if isinstance(field, EnumFieldMixin) and field.is_dirty(instance)
+    ]
+
+
+IMMUTABLE_TYPES = (str, bytes, int, float, bool, Decimal, datetime.date, datetime.time, datetime.timedelta, UUID)
+
+
+def _snapshot_value(value):
+    return value if value is None or isinstance(value, IMMUTABLE_TYPES) else copy.deepcopy(value)
+
+
+class DirtyEnumFieldsSaveMixin:
+    """
+    Opt-in model mixin which narrows saves of existing instances with changed enum fields to changed fields.
+    Values of other concrete fields are snapshotted when the instance is loaded or saved, therefore a plain
+    `save()` of a wide row where only an enum field changed updates only that field. Changed enum fields are
+    added to `update_fields` passed by the caller as well.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_fields(field_names)
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        if fields is None:
+            fields = [field.attname for field in self._meta.concrete_fields if field.attname in self.__dict__]
+        else:
+            fields = [self._meta.get_field(field).attname for field in fields]
+        self._snapshot_fields(fields)
+
+    def _snapshot_fields(self, attnames):
+        snapshot = self.__dict__.setdefault('_loaded_values', {})
+        for attname in attnames:
+            if attname in self.__dict__:
+                snapshot[attname] = _snapshot_value(self.__dict__[attname])
+
+    def get_changed_fields(self):
+        """
+        Return names of changed non-enum fields or None if their changes can't be determined.
+        """
+        snapshot = self.__dict__.get('_loaded_values')
+        if snapshot is None:
+            return None
+        changed = []
+        for field in self._meta.concrete_fields:
+            if isinstance(field, EnumFieldMixin) or field.attname not in self.__dict__:
+                continue
+            if field.attname not in snapshot or self.__dict__[field.attname] != snapshot[field.attname]:
+                if field.primary_key:
+                    return None
+                changed.append(field.name)
+            elif getattr(field, 'auto_now', False):
+                changed.append(field.name)
+        return changed
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if not self._state.adding and not kwargs.get('force_insert') and (update_fields is None or update_fields):
+            dirty_fields = get_dirty_enum_fields(self)
+            changed_fields = self.get_changed_fields() if update_fields is None else update_fields
+            if dirty_fields and changed_fields is not None:
+                kwargs['update_fields'] = list(dict.fromkeys([*changed_fields, *dirty_fields]))
+        super().save(*args, **kwargs)
+        self._snapshot_fields([
+            field.attname for field in self._meta.concrete_fields
+            if kwargs.get('update_fields') is None or field.name in kwargs['update_fields']
+        ])
+
+
 class EnumFieldMixin(EnumFieldValidationMixin):
 
+    # Enum is used only on the Python side, changes of the enum never alter the database column
+    non_db_attrs = models.Field.non_db_attrs + ('enum',)
+
     def __init__(self, enum, **options):
         self.enum = construct_enum(enum)
 
@@ -110,12 +294,31 @@ class EnumFieldMixin(EnumFieldValidationMixin):
 
         super().__init__(**options)
 
+    def get_lookup(self, lookup_name):
+        if lookup_name.startswith(EnumMetaLookup.prefix):
+            # Unknown attributes are reported by Django as unsupported lookups (FieldError)
+            if lookup_name[len(EnumMetaLookup.prefix):] not in getattr(self.enum, '_choice_attributes_', ()):
+                return None
+            return get_enum_meta_lookup(lookup_name)
+        return super().get_lookup(lookup_name)
+
     def refresh_from_db(self, instance):
         initial_field_name = self.get_initial_cache_name()
         instance.__dict__[initial_field_name] = getattr(instance, self.name)
 
+    def is_dirty(self, instance):
+        initial_field_name = self.get_initial_cache_name()
+        return (
+            initial_field_name in instance.__dict__
+            and instance.__dict__.get(self.name) != instance.__dict__[initial_field_name]
+        )
+
     def contribute_to_class(self, cls, name):
         super().contribute_to_class(cls, name)
+        if not hasattr(cls, 'get_dirty_enum_fields'):
+            cls.get_dirty_enum_fields = get_dirty_enum_fields
+        if not hasattr(cls, 'transition_to'):
+            cls.transition_to = transition_to
 
         def update_initial_field(instance, update_fields, **kwargs):
             if update_fields is None or self.name in update_fields:
@@ -135,18 +338,28 @@ class EnumFieldMixin(EnumFieldValidationMixin):
     def to_python(self, value):
         if isinstance(value, self.enum):
             return value
-        else:
-            value = super().to_python(value)
-            if value in [None, '']:
-                return None
-
+        # Fast path for raw values loaded from the database or deserialized from fixtures
+        try:
+            return self.enum._value2member_map_[value]
+        except (KeyError, TypeError):
+            pass
+        if isinstance(value, str):
             try:
-                return self.enum(value)
-            except ValueError:
-                raise ValidationError(
-                    '%s is not a valid value for enum %s' % (value, self.enum),
-                    code='invalid_enum_value'
-                )
+                return self.enum.str_value_map[value]
+            except KeyError:
+                pass
+
+        value = super().to_python(value)
+        if value in [None, '']:
+            return None
+
+        try:
+            return self.enum(value)
+        except ValueError:
+            raise ValidationError(
+                '%s is not a valid value for enum %s' % (value, self.enum),
+                code='invalid_enum_value'
+            )
 
     def get_prep_value(self, value):
         if value is None:
@@ -194,13 +407,36 @@ class EnumFieldMixin(EnumFieldValidationMixin):
         return name, path, args, keywords
 
     def get_choices(self, include_blank=True, blank_choice=BLANK_CHOICE_DASH):
-        # Force enum fields' options to use the `value` of the enumeration
-        # member as the `value` of SelectFields and similar.
-        return [
-            (i.value if isinstance(i, Enum) else i, display)
-            for (i, display)
-            in super().get_choices(include_blank, blank_choice)
-        ]
+        # Choices are cached per blank setting and active language, because labels are resolved here.
+        choices_cache = self.__dict__.setdefault('_choices_cache', {})
+        cache_key = (include_blank, tuple(blank_choice), get_language())
+        if cache_key not in choices_cache:
+            # Force enum fields' options to use the `value` of the enumeration
+            # member as the `value` of SelectFields and similar.
+            choices_cache[cache_key] = [
+                (i.value if isinstance(i, Enum) else i, str(display) if isinstance(display, Promise) else display)
+                for (i, display)
+                in super().get_choices(include_blank, blank_choice)
+            ]
+        return list(choices_cache[cache_key])
+
+    def get_transition_choices(self, value, include_blank=True):
+        """
+        Return choices limited to the current value and the members allowed by its `next` choices. Lists are
+        computed once per value, blank setting and active language.
+        """
+        if value is None or value.next is None:
+            return self.get_choices(include_blank=include_blank)
+
+        choices_cache = self.__dict__.setdefault('_transition_choices_cache', {})
+        cache_key = (value, include_blank, get_language())
+        if cache_key not in choices_cache:
+            allowed_values = {value.value} | {self.enum[name].value for name in value.next}
+            choices_cache[cache_key] = [
+                (choice_value, display) for choice_value, display in self.get_choices(include_blank=include_blank)
+                if choice_value in allowed_values or choice_value in ('', None)
+            ]
+        return list(choices_cache[cache_key])
 
     def formfield(self, form_class=None, choices_form_class=None, **kwargs):
         if not choices_form_class:
@@ -252,6 +488,8 @@ class IntegerEnumField(EnumFieldMixin, models.IntegerField):
 
 class EnumSubFieldMixin(EnumFieldValidationMixin):
 
+    non_db_attrs = EnumFieldMixin.non_db_attrs + ('parent_field_name',)
+
     def __init__(self, parent_field_name, enum, **options):
         self.parent_field_name = parent_field_name
         super().__init__(enum, **options)
@@ -266,9 +504,12 @@ class EnumSubFieldMixin(EnumFieldValidationMixin):
         return parents
 
     def _get_all_parent_choices(self, supvalue):
-        return {
-            choice for choice in self.enum if supvalue in choice.parents
-        }
+        try:
+            return set(self.enum.members_where(parents=supvalue))
+        except TypeError:
+            return {
+                choice for choice in self.enum if supvalue in choice.parents
+            }
 
     def _validate_parent_value_empty(self, value, supvalue):
         if supvalue not in self._get_all_parent_values() and value is not None:
@@ -302,3 +543,200 @@ class CharEnumSubField(EnumSubFieldMixin, CharEnumField):
 
 class IntegerEnumSubField(EnumSubFieldMixin, IntegerEnumField):
     pass
+
+
+def check_enum_set_field_bits(app_configs=None, **kwargs):
+    """
+    Report `EnumSetField`s whose implicitly assigned bit positions differ from the latest migrations on disk.
+    Migrations are loaded once per check run and only when some field doesn't pass `bits` explicitly.
+    """
+    from django.apps import apps
+    from django.db.migrations.loader import MigrationLoader
+
+    models_to_check = apps.get_models() if app_configs is None else [
+        model for app_config in app_configs for model in app_config.get_models()
+    ]
+    fields = [
+        field for model in models_to_check for field in model._meta.local_fields
+        if isinstance(field, EnumSetField) and not field.explicit_bits
+    ]
+    if not fields:
+        return []
+
+    state = MigrationLoader(None, ignore_no_migrations=True).project_state()
+    errors = []
+    for field in fields:
+        model_state = state.models.get((field.model._meta.app_label, field.model._meta.model_name))
+        if model_state is None or field.name not in model_state.fields:
+            continue
+        migrated_bits = model_state.fields[field.name].deconstruct()[3].get('bits')
+        changed = field.get_changed_bits(migrated_bits or {})
+        if changed:
+            errors.append(checks.Error(
+                'Bit positions of members {} changed since the last migration.'.format(', '.join(changed)),
+                hint='Pass bits={!r} to keep the meaning of stored values.'.format(migrated_bits),
+                obj=field,
+                id='enumfields.E001',
+            ))
+    return errors
+
+
+class EnumSetField(EnumFieldValidationMixin, models.BigIntegerField):
+    """
+    Field storing set of enum members as a bitmask in one integer column. Every member is assigned a bit position.
+    Members missing in `bits` get the next free positions in declaration order, bits of removed members stay
+    reserved. The assignment is recorded in migrations and a system check reports when implicitly assigned
+    positions differ from the migrated ones; pass the migrated `bits` explicitly in that case.
+    """
+
+    MAX_BITS = 63
+    non_db_attrs = models.BigIntegerField.non_db_attrs + ('enum', 'bits')
+
+    def __init__(self, enum, bits=None, **options):
+        self.enum = construct_enum(enum)
+        self.explicit_bits = bits is not None
+        bits = dict(bits or {})
+        next_bit = max(bits.values(), default=-1) + 1
+        for choice in self.enum:
+            if choice.name not in bits:
+                bits[choice.name] = next_bit
+                next_bit += 1
+        self.bits = bits
+        self.member_bits = {choice: bits[choice.name] for choice in self.enum}
+        if self.member_bits and max(self.member_bits.values()) >= self.MAX_BITS:
+            raise ValueError('Enum {} has too many members to be stored in a bitmask'.format(self.enum))
+        super().__init__(**options)
+
+    def get_changed_bits(self, migrated_bits):
+        """
+        Return names of members whose bit positions differ from `migrated_bits`.
+        """
+        return [name for name, bit in migrated_bits.items() if name in self.bits and self.bits[name] != bit]
+
+    @cached_property
+    def validators(self):
+        # Skip IntegerField range validators, values of the field are sets of members
+        return super(models.IntegerField, self).validators
+
+    def contribute_to_class(self, cls, name):
+        super().contribute_to_class(cls, name)
+        setattr(cls, name, CastOnAssignDescriptor(self))
+
+    def to_member(self, value):
+        if isinstance(value, self.enum):
+            return value
+        try:
+            return self.enum(value)
+        except ValueError:
+            try:
+                return self.enum.str_value_map[str(value)]
+            except KeyError:
+                raise ValidationError(
+                    '%s is not a valid value for enum %s' % (value, self.enum),
+                    code='invalid_enum_value'
+                )
+
+    def to_python(self, value):
+        if value is None:
+            return None
+        if isinstance(value, Enum):
+            return frozenset((self.to_member(value),))
+        if isinstance(value, str):
+            # Digit strings are bitmasks unless they are values of a text enum, e.g. zero-padded codes
+            if not issubclass(self.enum, int) and value in self.enum.str_value_map:
+                return frozenset((self.enum.str_value_map[value],))
+            if value.isdigit():
+                value = int(value)
+        if isinstance(value, int):
+            return frozenset(member for member, bit in self.member_bits.items() if value & (1 << bit))
+        if isinstance(value, str):
+            return frozenset((self.to_member(value),))
+        return frozenset(self.to_member(v) for v in value)
+
+    def get_prep_value(self, value):
+        if value is None:
+            return None
+        if isinstance(value, int) and not isinstance(value, Enum):
+            return value
+        member_bits = self.member_bits
+        mask = 0
+        for member in self.to_python(value):
+            mask |= 1 << member_bits[member]
+        return mask
+
+    def from_db_value(self, value, expression, connection, *args):
+        return self.to_python(value)
+
+    def value_to_string(self, obj):
+        return self.get_prep_value(self.value_from_object(obj))
+
+    def get_default(self):
+        return self.to_python(super().get_default())
+
+    def deconstruct(self):
+        name, path, args, keywords = super().deconstruct()
+        keywords['enum'] = deconstruct_enum(self.enum)
+        keywords['bits'] = self.bits
+        if 'default' in keywords and not callable(keywords['default']):
+            keywords['default'] = self.get_prep_value(keywords['default'])
+        return name, path, args, keywords
+
+    def formfield(self, **kwargs):
+        return super(models.IntegerField, self).formfield(**{
+            'form_class': EnumMultipleChoiceField,
+            'choices': self.enum.choices,
+            'coerce': self.to_member,
+            **kwargs,
+        })
+
+
+checks.register(check_enum_set_field_bits, checks.Tags.models)
+
+
+class EnumSetLookupMixin:
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return self.get_bitmask_sql(connection.ops.combine_expression('&', [lhs, rhs]), rhs), (
+            lhs_params + rhs_params + self.get_bitmask_params(rhs_params)
+        )
+
+
+@EnumSetField.register_lookup
+class EnumSetHasAll(EnumSetLookupMixin, Lookup):
+    """
+    Filter rows containing all given members, e.g. `tastes__has_all=[Taste.SWEET, Taste.SOUR]`.
+    """
+
+    lookup_name = 'has_all'
+
+    def get_bitmask_sql(self, bitand_sql, rhs):
+        return '({}) = {}'.format(bitand_sql, rhs)
+
+    def get_bitmask_params(self, rhs_params):
+        return rhs_params
+
+
+@EnumSetField.register_lookup
+class EnumSetHas(EnumSetHasAll):
+    """
+    Filter rows containing the given member, e.g. `tastes__has=Taste.SWEET`.
+    """
+
+    lookup_name = 'has'
+
+
+@EnumSetField.register_lookup
+class EnumSetHasAny(EnumSetLookupMixin, Lookup):
+    """
+    Filter rows containing at least one of given members, e.g. `tastes__has_any=[Taste.SWEET, Taste.SOUR]`.
+    """
+
+    lookup_name = 'has_any'
+
+    def get_bitmask_sql(self, bitand_sql, rhs):
+        return '({}) <> 0'.format(bitand_sql)
+
+    def get_bitmask_params(self, rhs_params):
+        return []
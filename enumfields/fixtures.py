@@ -0,0 +1,85 @@
+"""
+Streaming JSON Lines serialization format which stores enum fields by member names (natural keys) instead of values.
+
+Register it with `SERIALIZATION_MODULES = {'enumjsonl': 'enumfields.fixtures'}` and use
+`dumpdata --format enumjsonl` and `loaddata fixture.enumjsonl`.
+"""
+import json
+from itertools import islice
+
+from django.apps import apps
+from django.core.serializers import jsonl
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.python import Deserializer as PythonDeserializer
+
+from .fields import EnumFieldMixin, EnumSetField
+
+
+def get_enum_name_maps(model):
+    """
+    Return mapping of names of enum fields of the model to mappings of member names to values.
+    """
+    return {
+        field.name: {member.name: member.value for member in field.enum}
+        for field in model._meta.concrete_fields
+        if isinstance(field, (EnumFieldMixin, EnumSetField))
+    }
+
+
+class Serializer(jsonl.Serializer):
+    """
+    JSON Lines serializer writing enum members as their names, and members of `EnumSetField` as lists of names.
+    """
+
+    def handle_field(self, obj, field):
+        if isinstance(field, EnumFieldMixin):
+            member = field.value_from_object(obj)
+            self._current[field.name] = None if member is None else member.name
+        elif isinstance(field, EnumSetField):
+            members = field.value_from_object(obj)
+            self._current[field.name] = None if members is None else sorted(
+                member.name for member in members
+            )
+        else:
+            super().handle_field(obj, field)
+
+
+def names_to_values(obj, name_maps):
+    """
+    Replace member names of enum fields in the deserialized object with their values.
+    """
+    model_label = obj['model']
+    if model_label not in name_maps:
+        name_maps[model_label] = get_enum_name_maps(apps.get_model(model_label))
+    fields = obj['fields']
+    for field_name, names in name_maps[model_label].items():
+        name = fields.get(field_name)
+        if isinstance(name, list):
+            fields[field_name] = [names[n] for n in name]
+        elif name is not None:
+            fields[field_name] = names[name]
+    return obj
+
+
+def Deserializer(stream_or_string, batch_size=1000, **options):
+    """
+    Deserialize JSON Lines written by `Serializer`. Lines are read in batches of `batch_size` objects and member
+    names are converted to values with one dictionary lookup per field.
+    """
+    if isinstance(stream_or_string, bytes):
+        stream_or_string = stream_or_string.decode()
+    if isinstance(stream_or_string, str):
+        stream_or_string = stream_or_string.split('\n')
+
+    name_maps = {}
+    lines = (line for line in stream_or_string if line.strip())
+    while True:
+        batch = list(islice(lines, batch_size))
+        if not batch:
+            break
+        try:
+            yield from PythonDeserializer([names_to_values(json.loads(line), name_maps) for line in batch], **options)
+        except (GeneratorExit, DeserializationError):
+            raise
+        except Exception as exc:
+            raise DeserializationError() from exc
@@ -1,16 +1,41 @@
-from django.forms import TypedChoiceField
-from django.forms.fields import TypedMultipleChoiceField
+from django.core.exceptions import FieldDoesNotExist
+from django.forms import ChoiceField, TypedChoiceField
+from django.forms.fields import CallableChoiceIterator, TypedMultipleChoiceField
 
 from .enums import ChoicesEnum
 
 
 __all__ = (
-    'EnumChoiceField', 'EnumMultipleChoiceField'
+    'EnumChoiceField', 'EnumMultipleChoiceField', 'EnumFormSetMixin', 'EnumTransitionModelFormMixin'
 )
 
 
 class EnumChoiceFieldMixin:
 
+    _valid_values = None
+    clean_cache = None
+
+    def _set_choices(self, value):
+        ChoiceField._set_choices(self, value)
+        self._valid_values = None
+
+    choices = property(ChoiceField._get_choices, _set_choices)
+
+    def _get_valid_values(self):
+        """
+        Return set of string representations of valid choice keys. The set is computed once per choices assignment,
+        callable choices are not cached.
+        """
+        if self._valid_values is None and not isinstance(self.choices, CallableChoiceIterator):
+            valid_values = set()
+            for k, v in self.choices:
+                if isinstance(v, (list, tuple)):
+                    valid_values.update(str(k2) for k2, v2 in v)
+                else:
+                    valid_values.add(str(k))
+            self._valid_values = frozenset(valid_values)
+        return self._valid_values
+
     def prepare_value(self, value):
         # Widgets expect to get strings as values.
         if value is None:
@@ -20,6 +45,12 @@ class EnumChoiceFieldMixin:
         return super().prepare_value(value)
 
     def valid_value(self, value):
+        valid_values = self._get_valid_values()
+        if valid_values is not None:
+            if isinstance(value, ChoicesEnum):
+                value = value.value
+            return str(value) in valid_values
+
         if isinstance(value, ChoicesEnum):  # Try validation using the enum value first.
             if super().valid_value(value.value):
                 return True
@@ -30,6 +61,21 @@ class EnumChoiceFieldMixin:
             value = value.value
         return super().to_python(value)
 
+    def clean(self, value):
+        valid_values = self._get_valid_values()
+        if self.clean_cache is None or valid_values is None:
+            return super().clean(value)
+
+        try:
+            cache_key = (tuple(value) if isinstance(value, list) else value, self.required, valid_values)
+            cleaned_value = self.clean_cache[cache_key]
+        except TypeError:
+            return super().clean(value)
+        except KeyError:
+            # Invalid values raise ValidationError and are never cached, errors are reported by every form.
+            cleaned_value = self.clean_cache[cache_key] = super().clean(value)
+        return list(cleaned_value) if isinstance(cleaned_value, list) else cleaned_value
+
 
 class EnumChoiceField(EnumChoiceFieldMixin, TypedChoiceField):
     pass
@@ -44,3 +90,43 @@ class EnumMultipleChoiceField(EnumChoiceFieldMixin, TypedMultipleChoiceField):
         return [
             super_cls.prepare_value(v) for v in value
         ]
+
+
+class EnumFormSetMixin:
+    """
+    Formset mixin which shares cleaned values of enum form fields between all forms of the formset.
+    Every distinct raw value of a field is converted only once, validation errors stay reported per form.
+    """
+
+    def _construct_form(self, i, **kwargs):
+        form = super()._construct_form(i, **kwargs)
+        clean_caches = self.__dict__.setdefault('_enum_clean_caches', {})
+        for name, field in form.fields.items():
+            if isinstance(field, EnumChoiceFieldMixin):
+                field.clean_cache = clean_caches.setdefault(name, {})
+        return form
+
+
+class EnumTransitionModelFormMixin:
+    """
+    Model form mixin which limits choices of enum fields of existing instances to the current value
+    and values allowed by its `next` choices.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance._state.adding:
+            return
+
+        for name, form_field in self.fields.items():
+            if not isinstance(form_field, EnumChoiceField):
+                continue
+            try:
+                model_field = self.instance._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if hasattr(model_field, 'get_transition_choices'):
+                form_field.choices = model_field.get_transition_choices(
+                    self.instance.__dict__.get(model_field.get_initial_cache_name()),
+                    include_blank=any(value in ('', None) for value, _ in form_field.choices),
+                )
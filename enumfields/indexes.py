@@ -0,0 +1,41 @@
+from django.db import models
+
+from .fields import construct_enum
+
+
+def get_non_terminal_members(enum):
+    """
+    Return members which are not terminal states, i.e. whose `next` choices are not empty.
+    """
+    return [choice for choice in enum if choice.next != frozenset()]
+
+
+class EnumPartialIndex(models.Index):
+    """
+    Conditional index limited to rows with the given enum members, by default to non-terminal states of the enum.
+
+    The index is deconstructed as a plain `Index` with the computed condition, therefore changes of the enum
+    which change the indexed values generate new migrations.
+    """
+
+    def __init__(self, field_name, enum, members=None, *, name, fields=(), **kwargs):
+        self.field_name = field_name
+        self.enum = construct_enum(enum)
+        if members is None:
+            members = get_non_terminal_members(self.enum)
+        values = [self.enum(member).value for member in members]
+        super().__init__(
+            fields=list(fields) or [field_name],
+            name=name,
+            condition=models.Q(**{'{}__in'.format(field_name): values}),
+            **kwargs
+        )
+
+    def deconstruct(self):
+        path, args, kwargs = super().deconstruct()
+        return 'django.db.models.Index', args, kwargs
+
+    def clone(self):
+        # Model options clone indexes from their deconstructed form, which is a plain `Index`
+        _, args, kwargs = self.deconstruct()
+        return models.Index(*args, **kwargs)
@@ -0,0 +1,43 @@
+import enum
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .enums import ChoicesEnum
+
+
+__all__ = (
+    'EnumJSONEncoder', 'enum_default', 'enum_dec_hook'
+)
+
+
+def enum_default(obj):
+    """
+    `default` hook for JSON encoders (e.g. `orjson.dumps(data, default=enum_default)` or msgspec `enc_hook`)
+    which encodes choice enum members as their values instead of labels.
+    """
+    if isinstance(obj, ChoicesEnum):
+        return obj._value_
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(obj).__name__))
+
+
+def enum_dec_hook(type, obj):
+    """
+    msgspec `dec_hook` which decodes values back to choice enum members.
+    """
+    if isinstance(type, enum.EnumMeta) and issubclass(type, ChoicesEnum):
+        try:
+            return type._value2member_map_[obj]
+        except (KeyError, TypeError):
+            return type(obj)
+    raise NotImplementedError('Objects of type {} are not supported'.format(type))
+
+
+class EnumJSONEncoder(DjangoJSONEncoder):
+    """
+    JSON encoder which encodes choice enum members as their values.
+    """
+
+    def default(self, o):
+        if isinstance(o, ChoicesEnum):
+            return o._value_
+        return super().default(o)
@@ -0,0 +1,21 @@
+from django.core.management.commands import makemigrations
+
+from enumfields.autodetector import EnumMigrationAutodetector
+
+
+class Command(makemigrations.Command):
+    """
+    `makemigrations` which ignores changes of enums not affecting stored values. It is enabled by adding
+    `enumfields` to `INSTALLED_APPS`.
+    """
+
+    autodetector = EnumMigrationAutodetector
+
+    def handle(self, *args, **options):
+        # The base command instantiates the autodetector imported into its module
+        original_autodetector = makemigrations.MigrationAutodetector
+        makemigrations.MigrationAutodetector = self.autodetector
+        try:
+            return super().handle(*args, **options)
+        finally:
+            makemigrations.MigrationAutodetector = original_autodetector
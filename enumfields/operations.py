@@ -0,0 +1,130 @@
+from django.db import transaction
+from django.db.migrations.exceptions import IrreversibleError
+from django.db.migrations.operations.base import Operation
+
+from .fields import construct_enum
+
+
+def get_enum_value_mapping(old_enum, new_enum):
+    """
+    Return mapping of old values to new values of members with the same name in two enum states. Enums can be
+    passed as classes or in the deconstructed form stored in migrations.
+    """
+    old_enum, new_enum = construct_enum(old_enum), construct_enum(new_enum)
+    return {
+        old_member.value: new_enum[old_member.name].value
+        for old_member in old_enum
+        if old_member.name in new_enum.__members__ and old_member.value != new_enum[old_member.name].value
+    }
+
+
+class RemapEnumValues(Operation):
+    """
+    Migration operation which remaps stored enum values with chunked `UPDATE ... SET col = CASE ... END` statements
+    without loading model instances. Rows are selected in batches by primary key and every batch is committed
+    separately when the migration isn't atomic (`atomic = False`), so an interrupted migration can be rerun. Rerunning
+    is only safe when no new value is also an old value, e.g. for chains like `{1: 2, 2: 3}` or swaps rows already
+    remapped would be remapped again, therefore such mappings are rejected outside atomic migrations.
+    `progress_callback` is called with the number of already remapped rows after every batch.
+    """
+
+    reduces_to_sql = False
+
+    def __init__(self, model_name, name, mapping, batch_size=10000, progress_callback=None):
+        self.model_name = model_name
+        self.name = name
+        self.mapping = dict(mapping)
+        self.batch_size = batch_size
+        self.progress_callback = progress_callback
+
+    @classmethod
+    def from_enums(cls, model_name, name, old_enum, new_enum, **kwargs):
+        return cls(model_name, name, get_enum_value_mapping(old_enum, new_enum), **kwargs)
+
+    @property
+    def reversible(self):
+        return len(set(self.mapping.values())) == len(self.mapping)
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        self.remap(to_state.apps.get_model(app_label, self.model_name), schema_editor, self.mapping)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if not self.reversible:
+            raise IrreversibleError('Mapping of {} values is not one-to-one'.format(self.name))
+        self.remap(
+            to_state.apps.get_model(app_label, self.model_name),
+            schema_editor,
+            {new_value: old_value for old_value, new_value in self.mapping.items()}
+        )
+
+    def remap(self, model, schema_editor, mapping):
+        connection = schema_editor.connection
+        if not mapping or not self.allow_migrate_model(connection.alias, model):
+            return
+        if not schema_editor.atomic_migration and set(mapping).intersection(mapping.values()):
+            raise ValueError(
+                'Mapping of {} values overlaps with remapped values and can\'t be rerun safely after interruption '
+                'outside atomic migrations, remap the values in several operations through unused values '
+                'instead.'.format(self.name)
+            )
+
+        quote_name = schema_editor.quote_name
+        table = quote_name(model._meta.db_table)
+        column = quote_name(model._meta.get_field(self.name).column)
+        pk_column = quote_name(model._meta.pk.column)
+        old_values = list(mapping)
+        old_values_sql = ', '.join(['%s'] * len(old_values))
+        case_sql = 'CASE {} {} END'.format(column, ' '.join(['WHEN %s THEN %s'] * len(mapping)))
+        case_params = [value for item in mapping.items() for value in item]
+
+        remapped = 0
+        last_pk = None
+        while True:
+            select_sql = 'SELECT {pk} FROM {table} WHERE {column} IN ({values})'.format(
+                pk=pk_column, table=table, column=column, values=old_values_sql
+            )
+            select_params = list(old_values)
+            if last_pk is not None:
+                select_sql += ' AND {} > %s'.format(pk_column)
+                select_params.append(last_pk)
+            select_sql += ' ORDER BY {} LIMIT {:d}'.format(pk_column, self.batch_size)
+
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                cursor.execute(select_sql, select_params)
+                pks = [row[0] for row in cursor.fetchall()]
+                if not pks:
+                    break
+                cursor.execute(
+                    'UPDATE {table} SET {column} = {case} WHERE {pk} IN ({pks})'.format(
+                        table=table, column=column, case=case_sql, pk=pk_column, pks=', '.join(['%s'] * len(pks))
+                    ),
+                    case_params + pks
+                )
+            remapped += len(pks)
+            last_pk = pks[-1]
+            if self.progress_callback:
+                self.progress_callback(remapped)
+
+    def describe(self):
+        return 'Remap values of {}.{}'.format(self.model_name, self.name)
+
+    @property
+    def migration_name_fragment(self):
+        return 'remap_{}_{}'.format(self.model_name.lower(), self.name.lower())
+
+
+class RenameEnumValue(RemapEnumValues):
+    """
+    Migration operation which renames one stored enum value.
+    """
+
+    def __init__(self, model_name, name, old_value, new_value, **kwargs):
+        self.old_value = old_value
+        self.new_value = new_value
+        super().__init__(model_name, name, {old_value: new_value}, **kwargs)
+
+    def describe(self):
+        return 'Rename value {!r} of {}.{} to {!r}'.format(self.old_value, self.model_name, self.name, self.new_value)
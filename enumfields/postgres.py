@@ -0,0 +1,52 @@
+from django.contrib.postgres.fields import ArrayField
+
+from .fields import CharEnumField, IntegerEnumField, construct_enum, deconstruct_enum
+from .forms import EnumMultipleChoiceField
+
+
+class EnumArrayField(ArrayField):
+    """
+    PostgreSQL array of enum values. Arrays are converted in one batch, `__contains` and `__overlap`
+    lookups compile to `@>` and `&&` operators and can be served by a `GinIndex`.
+    """
+
+    def __init__(self, enum, base_field=None, size=None, **kwargs):
+        self.enum = construct_enum(enum)
+        if base_field is None:
+            base_field = (IntegerEnumField if issubclass(self.enum, int) else CharEnumField)(self.enum)
+        super().__init__(base_field, size=size, **kwargs)
+
+    def _from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        value2member_map = self.enum._value2member_map_
+        try:
+            return [value2member_map[item] for item in value]
+        except (KeyError, TypeError):
+            return super()._from_db_value(value, expression, connection)
+
+    def to_python(self, value):
+        value = super().to_python(value)
+        if isinstance(value, (list, tuple)):
+            return [self.base_field.to_python(item) for item in value]
+        return value
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if isinstance(value, (list, tuple)):
+            enum = self.enum
+            base_field = self.base_field
+            return [item.value if isinstance(item, enum) else base_field.get_prep_value(item) for item in value]
+        return value
+
+    def deconstruct(self):
+        name, path, args, keywords = super().deconstruct()
+        keywords['enum'] = deconstruct_enum(self.enum)
+        return name, path, args, keywords
+
+    def formfield(self, **kwargs):
+        return super(ArrayField, self).formfield(**{
+            'form_class': EnumMultipleChoiceField,
+            'choices': self.enum.choices,
+            'coerce': self.base_field.to_python,
+            **kwargs,
+        })
@@ -0,0 +1,175 @@
+import threading
+from datetime import timedelta
+from functools import partial
+
+from django.db import connections, models, router, transaction
+from django.db.models import F, Window
+from django.db.models.functions import Lead
+from django.db.models.signals import post_save, pre_save
+from django.utils import timezone
+
+from .fields import EnumFieldMixin
+
+
+class EnumTransitionQuerySet(models.QuerySet):
+
+    def for_instance(self, instance, field_name):
+        return self.filter(model=instance._meta.label_lower, object_pk=str(instance.pk), field_name=field_name)
+
+    def with_duration(self):
+        """
+        Annotate every transition with `left_at` (time of the following transition of the same object and field)
+        and `duration` spent in the `to_value` state. Both are None for current states.
+        """
+        return self.annotate(
+            left_at=Window(
+                Lead('created_at'),
+                partition_by=[F('model'), F('object_pk'), F('field_name')],
+                order_by=F('created_at').asc(),
+            ),
+        ).annotate(
+            duration=models.ExpressionWrapper(F('left_at') - F('created_at'), output_field=models.DurationField())
+        )
+
+    def time_in_states(self, now=None):
+        """
+        Return dict of total time spent in every state. Time of current states is counted up to `now`.
+        """
+        now = now or timezone.now()
+        result = {}
+        for to_value, created_at, left_at in self.with_duration().values_list('to_value', 'created_at', 'left_at'):
+            result[to_value] = result.get(to_value, timedelta()) + ((left_at or now) - created_at)
+        return result
+
+
+class AbstractEnumTransition(models.Model):
+    """
+    Abstract model of transition audit log entries written by `TransitionRecorder`.
+    """
+
+    model = models.CharField(max_length=100)
+    object_pk = models.CharField(max_length=255)
+    field_name = models.CharField(max_length=100)
+    from_value = models.CharField(max_length=255, null=True, blank=True)
+    to_value = models.CharField(max_length=255, null=True, blank=True)
+    created_at = models.DateTimeField(db_index=True)
+
+    objects = EnumTransitionQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+        indexes = [models.Index(fields=['model', 'object_pk', 'field_name', 'created_at'])]
+
+
+def _to_db_string(value):
+    return None if value is None else str(getattr(value, 'value', value))
+
+
+class TransitionRecorder:
+    """
+    Records transitions of enum fields into a model inheriting from `AbstractEnumTransition`.
+
+    Transitions are captured from the initial values tracked by enum fields. Transitions of saves in transactions
+    are written with one `bulk_create` per save after the transaction is committed. Transitions of saves outside
+    transactions are added to an in-memory buffer which is written when it reaches `batch_size` or periodically
+    by the background thread started with `start()`. Entries are written without `post_save` overhead, but entries
+    still buffered are lost when the process is killed; call `flush()` at the end of a worker task if needed.
+
+    Transitions saved with `transition_to` are written by an `UPDATE` query without `post_save` and aren't recorded.
+    """
+
+    def __init__(self, transition_model, batch_size=1000):
+        self.transition_model = transition_model
+        self.batch_size = batch_size
+        self._fields = {}
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._flush_thread = None
+        self._stop_event = threading.Event()
+
+    def register(self, model, *field_names):
+        fields = [model._meta.get_field(field_name) for field_name in field_names]
+        for field in fields:
+            if not isinstance(field, EnumFieldMixin) or not any(choice.next is not None for choice in field.enum):
+                raise ValueError('Field {} is not an enum field with transitions'.format(field))
+        self._fields[model] = fields
+        pre_save.connect(self._capture_transitions, sender=model, weak=False)
+        post_save.connect(self._record_transitions, sender=model, weak=False)
+
+    def unregister(self, model):
+        self._fields.pop(model, None)
+        pre_save.disconnect(self._capture_transitions, sender=model)
+        post_save.disconnect(self._record_transitions, sender=model)
+
+    def _capture_transitions(self, sender, instance, update_fields=None, **kwargs):
+        transitions = []
+        for field in self._fields.get(sender, ()):
+            if update_fields is not None and field.name not in update_fields:
+                continue
+            from_value = None if instance._state.adding else instance.__dict__.get(field.get_initial_cache_name())
+            to_value = instance.__dict__.get(field.name)
+            if instance._state.adding or from_value != to_value:
+                transitions.append((field.name, from_value, to_value))
+        instance.__dict__['_enum_transitions'] = transitions
+
+    def _record_transitions(self, sender, instance, using, **kwargs):
+        transitions = instance.__dict__.pop('_enum_transitions', None)
+        if not transitions:
+            return
+
+        created_at = timezone.now()
+        entries = [
+            self.transition_model(
+                model=sender._meta.label_lower,
+                object_pk=str(instance.pk),
+                field_name=field_name,
+                from_value=_to_db_string(from_value),
+                to_value=_to_db_string(to_value),
+                created_at=created_at,
+            )
+            for field_name, from_value, to_value in transitions
+        ]
+        if transaction.get_connection(using).in_atomic_block:
+            # Hooks of saves rolled back to a savepoint are discarded by Django, entries of every committed save are
+            # written right after the commit.
+            transaction.on_commit(partial(self._add, entries, flush=True), using=using)
+        else:
+            self._add(entries)
+
+    def _add(self, entries, flush=False):
+        with self._lock:
+            self._buffer.extend(entries)
+            flush = flush or len(self._buffer) >= self.batch_size
+        if flush:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            entries, self._buffer = self._buffer, []
+        if entries:
+            self.transition_model._default_manager.using(
+                router.db_for_write(self.transition_model)
+            ).bulk_create(entries, batch_size=self.batch_size)
+
+    def start(self, flush_interval=1.0):
+        """
+        Start background thread flushing the buffer every `flush_interval` seconds.
+        """
+        if self._flush_thread is None:
+            self._stop_event.clear()
+            self._flush_thread = threading.Thread(target=self._run, args=(flush_interval,), daemon=True)
+            self._flush_thread.start()
+
+    def stop(self):
+        if self._flush_thread is not None:
+            self._stop_event.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+
+    def _run(self, flush_interval):
+        try:
+            while not self._stop_event.wait(flush_interval):
+                self.flush()
+        finally:
+            connections.close_all()
@@ -1,6 +1,9 @@
 from django.db import models
 
-from enumfields import CharEnumField, IntegerEnumField, IntegerEnumSubField
+from enumfields import CharEnumField, EnumSetField, IntegerEnumField, IntegerEnumSubField
+from enumfields.fields import DirtyEnumFieldsSaveMixin
+from enumfields.indexes import EnumPartialIndex
+from enumfields.transitions import AbstractEnumTransition
 
 from .enums import Color, IntegerEnum, LabeledEnum, StateFlow, StateFlowAnyFirst, SubIntegerEnum, Taste, ZeroEnum
 
@@ -23,3 +26,22 @@ class MyModel(models.Model):
     labeled_enum = CharEnumField(LabeledEnum, blank=True, null=True)
     state = IntegerEnumField(StateFlow, default=StateFlow.START)
     any_first_state = IntegerEnumField(StateFlowAnyFirst, default=StateFlowAnyFirst.START)
+    tastes = EnumSetField(Taste, default=frozenset(), blank=True)
+
+    class Meta:
+        indexes = [EnumPartialIndex('state', StateFlow, name='mymodel_active_state_idx')]
+
+
+class DirtyModel(DirtyEnumFieldsSaveMixin, models.Model):
+    state = IntegerEnumField(StateFlow, default=StateFlow.START)
+    color = CharEnumField(Color, max_length=1, default=Color.RED)
+    note = models.TextField(blank=True)
+
+
+class DirtyEnumOnlyModel(DirtyEnumFieldsSaveMixin, models.Model):
+    state = IntegerEnumField(StateFlow, default=StateFlow.START)
+    color = CharEnumField(Color, max_length=1, default=Color.RED)
+
+
+class StateTransition(AbstractEnumTransition):
+    pass
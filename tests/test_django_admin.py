@@ -3,8 +3,12 @@ import re
 import uuid
 
 import pytest
+from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.core.cache import cache
 
 from enumfields import IntegerEnumField
+from enumfields.admin import EnumFieldCountListFilter, EnumFieldListFilter, EnumFieldMultipleListFilter
 
 from .enums import Color, IntegerEnum, StateFlow, StateFlowAnyFirst, Taste, ZeroEnum
 from .models import MyModel
@@ -78,3 +82,140 @@ def test_django_admin_lookup_value_for_integer_enum_field():
     field = IntegerEnumField(Taste)
 
     assert field.get_prep_value(str(Taste.BITTER.value)) == 3, "get_prep_value should be able to convert from strings"
+
+
+class CountFilterAdmin(admin.ModelAdmin):
+
+    list_filter = [
+        ('color', EnumFieldListFilter),
+        ('taste', EnumFieldCountListFilter),
+    ]
+
+
+@pytest.mark.django_db
+def test_model_admin_count_filter(rf, admin_user, django_assert_num_queries):
+    for taste in (Taste.SWEET, Taste.SWEET, Taste.SOUR):
+        MyModel.objects.create(color=Color.BLUE, taste=taste)
+    MyModel.objects.create(color=Color.RED, taste=Taste.BITTER)
+
+    request = rf.get('/', {'color__exact': Color.BLUE.value, 'taste__exact': Taste.SOUR.value})
+    request.user = admin_user
+    cl = CountFilterAdmin(MyModel, admin.site).get_changelist_instance(request)
+    taste_filter = cl.filter_specs[1]
+
+    with django_assert_num_queries(1):
+        choices = list(taste_filter.choices(cl))
+
+    assert [choice['display'] for choice in choices] == ['All', 'Sweet (2)', 'Sour (1)']
+    assert [choice['selected'] for choice in choices] == [False, False, True]
+
+
+class CachedCountListFilter(EnumFieldCountListFilter):
+    count_cache_timeout = 60
+
+
+class CachedCountFilterAdmin(admin.ModelAdmin):
+
+    list_filter = [
+        ('color', CachedCountListFilter),
+        ('taste', CachedCountListFilter),
+    ]
+
+
+@pytest.mark.django_db
+def test_model_admin_cached_count_filters(rf, admin_user):
+    cache.clear()
+    MyModel.objects.create(color=Color.BLUE, taste=Taste.SOUR)
+
+    request = rf.get('/')
+    request.user = admin_user
+    cl = CachedCountFilterAdmin(MyModel, admin.site).get_changelist_instance(request)
+    color_choices, taste_choices = [[c['display'] for c in spec.choices(cl)] for spec in cl.filter_specs]
+
+    assert color_choices == ['All', 'bluë (1)']
+    assert taste_choices == ['All', 'Sour (1)']
+
+
+class DuplicatesCountFilterAdmin(CountFilterAdmin):
+
+    def get_search_results(self, request, queryset, search_term):
+        return queryset, True
+
+
+@pytest.mark.django_db
+def test_model_admin_count_filter_distinct(rf, admin_user, django_assert_num_queries):
+    MyModel.objects.create(color=Color.BLUE, taste=Taste.SOUR)
+
+    request = rf.get('/')
+    request.user = admin_user
+    cl = DuplicatesCountFilterAdmin(MyModel, admin.site).get_changelist_instance(request)
+
+    with django_assert_num_queries(1) as captured:
+        choices = [choice['display'] for choice in cl.filter_specs[1].choices(cl)]
+    assert 'COUNT(DISTINCT' in captured.captured_queries[0]['sql']
+    assert choices == ['All', 'Sour (1)']
+
+
+class UnselectedSimpleListFilter(admin.SimpleListFilter):
+    title = 'note'
+    parameter_name = 'note'
+
+    def lookups(self, request, model_admin):
+        return [('x', 'X')]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(random_code=self.value())
+
+
+class MixedFiltersAdmin(admin.ModelAdmin):
+
+    list_filter = [
+        UnselectedSimpleListFilter,
+        ('taste', EnumFieldCountListFilter),
+    ]
+
+
+@pytest.mark.django_db
+def test_model_admin_count_filter_matches_changelist(rf, admin_user):
+    MyModel.objects.create(color=Color.RED, taste=Taste.SOUR)
+    MyModel.objects.create(color=Color.BLUE, taste=Taste.SWEET)
+
+    request = rf.get('/', {'color': Color.RED.value})
+    request.user = admin_user
+    cl = MixedFiltersAdmin(MyModel, admin.site).get_changelist_instance(request)
+
+    assert [obj.taste for obj in cl.queryset] == [Taste.SOUR]
+    assert [choice['display'] for choice in cl.filter_specs[1].choices(cl)] == ['All', 'Sour (1)']
+
+
+class MultipleFilterAdmin(admin.ModelAdmin):
+
+    list_filter = [
+        ('taste', EnumFieldMultipleListFilter),
+    ]
+
+
+@pytest.mark.django_db
+def test_model_admin_multiple_filter(rf, admin_user):
+    for taste in Taste:
+        MyModel.objects.create(color=Color.BLUE, taste=taste)
+
+    request = rf.get('/', {'taste__in': '{},{}'.format(Taste.SOUR.value, Taste.UMAMI.value)})
+    request.user = admin_user
+    cl = MultipleFilterAdmin(MyModel, admin.site).get_changelist_instance(request)
+
+    assert {obj.taste for obj in cl.queryset} == {Taste.SOUR, Taste.UMAMI}
+
+    choices = list(cl.filter_specs[0].choices(cl))
+    assert [choice['selected'] for choice in choices] == [False, False, True, False, False, True]
+    assert choices[1]['query_string'] == '?taste__in=1%2C2%2C5'
+    assert choices[2]['query_string'] == '?taste__in=5'
+
+
+@pytest.mark.django_db
+def test_model_admin_multiple_filter_invalid_value(rf, admin_user):
+    request = rf.get('/', {'taste__in': '1,42'})
+    request.user = admin_user
+    with pytest.raises(IncorrectLookupParameters):
+        MultipleFilterAdmin(MyModel, admin.site).get_changelist_instance(request)
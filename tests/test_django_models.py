@@ -1,12 +1,15 @@
 # -- encoding: UTF-8 --
 
+from asgiref.sync import async_to_sync
 from django.core.exceptions import ValidationError
 from django.db import connection
 
 import pytest
 
+from enumfields.fields import EnumTransitionConflict, atransition, transition
+
 from .enums import Color, IntegerEnum, LabeledEnum, StateFlow, StateFlowAnyFirst, SubIntegerEnum, Taste, ZeroEnum
-from .models import MyModel
+from .models import DirtyEnumOnlyModel, DirtyModel, MyModel
 
 
 @pytest.mark.django_db
@@ -70,6 +73,17 @@ def test_serialization():
     assert fields["taste"] == m.taste.value
 
 
+@pytest.mark.parametrize('format', ('json', 'python'))
+def test_deserialization(format):
+    from django.core import serializers
+    data = serializers.serialize(format, [MyModel(color=Color.RED, taste=Taste.SALTY, int_enum=IntegerEnum.A)])
+    obj = next(serializers.deserialize(format, data)).object
+    assert obj.color is Color.RED
+    assert obj.taste is Taste.SALTY
+    assert obj.int_enum is IntegerEnum.A
+    assert obj.zero_field is None
+
+
 @pytest.mark.django_db
 def test_nonunique_label():
     obj = MyModel.objects.create(
@@ -139,3 +153,124 @@ def test_initial_enum_field():
     with pytest.raises(ValidationError):
         # END is not initial state
         MyModel(color=Color.RED, state=StateFlow.END).full_clean()
+
+
+@pytest.mark.django_db
+def test_transition():
+    model = MyModel.objects.create(color=Color.RED)
+
+    with pytest.raises(ValidationError):
+        transition(model, 'any_first_state', StateFlowAnyFirst.END)
+    assert model.any_first_state is StateFlowAnyFirst.START
+
+    transition(model, 'any_first_state', StateFlowAnyFirst.PROCESSING.value)
+    assert MyModel.objects.get(pk=model.pk).any_first_state is StateFlowAnyFirst.PROCESSING
+
+    transition(model, 'any_first_state', StateFlowAnyFirst.END)
+    assert MyModel.objects.get(pk=model.pk).any_first_state is StateFlowAnyFirst.END
+
+
+@pytest.mark.django_db(transaction=True)
+def test_atransition():
+    async def run():
+        model = await MyModel.objects.acreate(color=Color.RED)
+        with pytest.raises(ValidationError):
+            await atransition(model, 'any_first_state', StateFlowAnyFirst.END)
+
+        await atransition(model, 'any_first_state', StateFlowAnyFirst.PROCESSING)
+        model_from_db = await MyModel.objects.aget(pk=model.pk)
+        assert model_from_db.any_first_state is StateFlowAnyFirst.PROCESSING
+
+        # initial values are refreshed by arefresh_from_db as well
+        model_from_db.any_first_state = StateFlowAnyFirst.START
+        await model_from_db.arefresh_from_db()
+        with pytest.raises(ValidationError):
+            await atransition(model_from_db, 'any_first_state', StateFlowAnyFirst.START, save=False)
+        await atransition(model, 'any_first_state', StateFlowAnyFirst.END)
+
+    async_to_sync(run)()
+
+
+@pytest.mark.django_db
+def test_get_dirty_enum_fields():
+    model = MyModel.objects.create(color=Color.RED)
+    assert model.get_dirty_enum_fields() == []
+
+    model.state = StateFlow.PROCESSING
+    model.color = Color.RED
+    assert model.get_dirty_enum_fields() == ['state']
+    model.save()
+    assert model.get_dirty_enum_fields() == []
+
+    model = MyModel.objects.get(pk=model.pk)
+    model.taste = Taste.SOUR
+    assert model.get_dirty_enum_fields() == ['taste']
+
+
+@pytest.mark.django_db
+def test_dirty_enum_fields_save(django_assert_num_queries):
+    model = DirtyModel.objects.create(note='original')
+    model = DirtyModel.objects.get(pk=model.pk)
+    DirtyModel.objects.filter(pk=model.pk).update(note='concurrent')
+
+    model.state = StateFlow.PROCESSING
+    with django_assert_num_queries(1) as captured:
+        model.save()
+    assert '"note"' not in captured.captured_queries[0]['sql']
+    model = DirtyModel.objects.get(pk=model.pk)
+    assert (model.state, model.note) == (StateFlow.PROCESSING, 'concurrent')
+
+    model.state = StateFlow.END
+    model.note = 'changed'
+    model.save()
+    model = DirtyModel.objects.get(pk=model.pk)
+    assert (model.state, model.note) == (StateFlow.END, 'changed')
+
+    model.color = Color.BLUE
+    model.note = 'explicit'
+    model.save(update_fields=['note'])
+    model = DirtyModel.objects.get(pk=model.pk)
+    assert (model.color, model.note) == (Color.BLUE, 'explicit')
+
+    model.note = 'full save'
+    assert model.get_changed_fields() == ['note']
+    model.save()
+    assert DirtyModel.objects.get(pk=model.pk).note == 'full save'
+    assert model.get_changed_fields() == []
+
+    model.note = 'discarded'
+    model.refresh_from_db()
+    assert model.get_changed_fields() == []
+
+
+@pytest.mark.django_db
+def test_dirty_enum_fields_save_enum_only_model(django_assert_num_queries):
+    model = DirtyEnumOnlyModel.objects.create()
+    DirtyEnumOnlyModel.objects.filter(pk=model.pk).update(color=Color.GREEN)
+
+    model.state = StateFlow.PROCESSING
+    with django_assert_num_queries(1) as captured:
+        model.save()
+    assert '"color"' not in captured.captured_queries[0]['sql']
+    model = DirtyEnumOnlyModel.objects.get(pk=model.pk)
+    assert (model.state, model.color) == (StateFlow.PROCESSING, Color.GREEN)
+
+
+@pytest.mark.django_db
+def test_transition_to():
+    model = MyModel.objects.create(color=Color.RED)
+    concurrent_model = MyModel.objects.get(pk=model.pk)
+
+    with pytest.raises(ValidationError):
+        model.transition_to('state', StateFlow.END)
+
+    assert model.transition_to('state', StateFlow.PROCESSING) is StateFlow.PROCESSING
+    assert model.state is StateFlow.PROCESSING
+    assert MyModel.objects.get(pk=model.pk).state is StateFlow.PROCESSING
+
+    with pytest.raises(EnumTransitionConflict):
+        concurrent_model.transition_to('state', StateFlow.PROCESSING)
+    assert concurrent_model.state is StateFlow.START
+
+    model.transition_to('state', StateFlow.END)
+    assert MyModel.objects.get(pk=model.pk).state is StateFlow.END
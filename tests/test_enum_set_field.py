@@ -0,0 +1,84 @@
+import pytest
+from django.core.checks.registry import registry
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.forms.models import modelform_factory
+
+from enumfields import EnumSetField, TextChoicesEnum
+from enumfields.fields import check_enum_set_field_bits
+
+from .enums import Color, Taste
+from .models import MyModel
+
+
+@pytest.mark.django_db
+def test_enum_set_field_value():
+    m = MyModel.objects.create(color=Color.RED, tastes=[Taste.SWEET, Taste.UMAMI])
+    assert m.tastes == frozenset({Taste.SWEET, Taste.UMAMI})
+
+    cursor = connection.cursor()
+    cursor.execute('SELECT tastes FROM %s WHERE id = %%s' % MyModel._meta.db_table, [m.pk])
+    assert cursor.fetchone()[0] == 0b10001
+
+    m = MyModel.objects.get(pk=m.pk)
+    assert m.tastes == frozenset({Taste.SWEET, Taste.UMAMI})
+    assert MyModel(color=Color.RED).tastes == frozenset()
+
+
+@pytest.mark.django_db
+def test_enum_set_field_lookups():
+    sweet_umami = MyModel.objects.create(color=Color.RED, tastes={Taste.SWEET, Taste.UMAMI})
+    sweet = MyModel.objects.create(color=Color.RED, tastes={Taste.SWEET})
+    MyModel.objects.create(color=Color.RED)
+
+    assert set(MyModel.objects.filter(tastes__has=Taste.SWEET)) == {sweet_umami, sweet}
+    assert set(MyModel.objects.filter(tastes__has_all=[Taste.SWEET, Taste.UMAMI])) == {sweet_umami}
+    assert set(MyModel.objects.filter(tastes__has_any=[Taste.SOUR, Taste.UMAMI])) == {sweet_umami}
+    assert set(MyModel.objects.filter(tastes=[Taste.SWEET])) == {sweet}
+
+
+def test_enum_set_field_deconstruct():
+    field = EnumSetField(Taste, bits={'SWEET': 3, 'SOUR': 0}, default=[Taste.SWEET])
+    _, _, _, kwargs = field.deconstruct()
+    assert kwargs['bits'] == {'SWEET': 3, 'SOUR': 0, 'BITTER': 4, 'SALTY': 5, 'UMAMI': 6}
+    assert kwargs['default'] == 0b1000
+    assert field.to_python(0b1001) == frozenset({Taste.SWEET, Taste.SOUR})
+
+
+def test_enum_set_field_formfield():
+    form_cls = modelform_factory(MyModel, fields=('tastes',))
+    form = form_cls(data={'tastes': ['1', '3']})
+    assert form.is_valid(), form.errors
+    assert form.cleaned_data['tastes'] == [Taste.SWEET, Taste.BITTER]
+    assert not form_cls(data={'tastes': ['42']}).is_valid()
+
+
+def test_enum_set_field_frozen_bits():
+    field = EnumSetField(Taste, bits={'SOUR': 0, 'SWEET': 1, 'REMOVED': 2})
+    assert field.bits == {'SOUR': 0, 'SWEET': 1, 'REMOVED': 2, 'BITTER': 3, 'SALTY': 4, 'UMAMI': 5}
+    assert field.get_changed_bits({'SWEET': 0, 'SOUR': 1, 'REMOVED': 2}) == ['SWEET', 'SOUR']
+    assert field.get_changed_bits({'SOUR': 0, 'SWEET': 1}) == []
+    assert check_enum_set_field_bits() == []
+    assert check_enum_set_field_bits in registry.registered_checks
+
+
+def test_enum_set_field_to_python_single_value():
+    field = EnumSetField(Color)
+    assert field.to_python('r') == frozenset({Color.RED})
+    assert field.to_python(['r', Color.BLUE]) == frozenset({Color.RED, Color.BLUE})
+    with pytest.raises(ValidationError):
+        field.to_python('red')
+
+
+class Country(TextChoicesEnum):
+    DZA = '004'
+    AFG = '008'
+    ALB = '012'
+
+
+def test_enum_set_field_to_python_digit_values():
+    field = EnumSetField(Country)
+    assert field.to_python('004') == frozenset({Country.DZA})
+    assert field.to_python('008') == frozenset({Country.AFG})
+    assert field.to_python('3') == frozenset({Country.DZA, Country.AFG})
+    assert EnumSetField(Taste).to_python('3') == frozenset({Taste.SWEET, Taste.SOUR})
@@ -1,13 +1,20 @@
 # -- encoding: UTF-8 --
 from __future__ import unicode_literals
 
+import os
+import pickle
+import subprocess
+import sys
+
 import pytest
-from django.core.exceptions import ValidationError
+from django.core.exceptions import FieldError, ValidationError
 from django.forms import BaseForm
 
-from enumfields import Choice, TextChoicesEnum, CharEnumField
+from enumfields import Choice, IntegerChoicesEnum, TextChoicesEnum, CharEnumField
+from enumfields.fields import construct_enum, deconstruct_enum
 
-from .enums import Color, IntegerEnum, IntegerAutoEnum, TextAutoEnum
+from .enums import Color, IntegerEnum, IntegerAutoEnum, StateFlow, SubIntegerEnum, Taste, TextAutoEnum
+from .models import MyModel
 
 
 def test_choice_ordering():
@@ -86,3 +93,120 @@ def test_auto_text_enum_should_generate_right_values():
     assert TextAutoEnum.A.value == 'A'
     assert TextAutoEnum.B.value == 'B'
     assert TextAutoEnum.C.value == 'C'
+
+
+def test_choice_metadata_is_immutable():
+    assert StateFlow.START.next == frozenset({'PROCESSING'})
+    assert isinstance(StateFlow.END.next, frozenset)
+    assert SubIntegerEnum.C.parents == (IntegerEnum.A, IntegerEnum.B)
+
+    with pytest.raises(TypeError):
+        StateFlow._value2data_map_[StateFlow.START.value]['next'] = {'END'}
+    with pytest.raises(TypeError):
+        StateFlow._value2data_map_[StateFlow.START.value] = {}
+
+
+def test_pickle_members():
+    for member in (Color.BLUE, IntegerEnum.A, StateFlow.END):
+        assert pickle.loads(pickle.dumps(member)) is member
+    assert pickle.loads(pickle.dumps([Taste.SOUR, Taste.SWEET])) == [Taste.SOUR, Taste.SWEET]
+
+    dynamic_enum = construct_enum(deconstruct_enum(Taste))
+    assert pickle.loads(pickle.dumps(dynamic_enum.SOUR)) is dynamic_enum.SOUR
+    dynamic_state = construct_enum(deconstruct_enum(StateFlow))
+    assert pickle.loads(pickle.dumps(dynamic_state.END)) is dynamic_state.END
+
+
+def test_unpickle_members_in_new_process():
+    dynamic_enum = construct_enum(deconstruct_enum(Taste))
+    data = pickle.dumps([Taste.SOUR, Color.BLUE, StateFlow.END, dynamic_enum.UMAMI])
+    code = (
+        'import pickle, sys, django; django.setup(); '
+        'print([repr(m) for m in pickle.loads(sys.stdin.buffer.read())])'
+    )
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE='tests.settings')
+    result = subprocess.run([sys.executable, '-c', code], input=data, capture_output=True, env=env, check=True)
+    assert result.stdout.decode().strip() == str(
+        [repr(Taste.SOUR), repr(Color.BLUE), repr(StateFlow.END), repr(dynamic_enum.UMAMI)]
+    )
+
+
+def test_unpickle_after_members_were_appended(monkeypatch):
+    data = pickle.dumps(Taste.SOUR)
+
+    class Taste2(IntegerChoicesEnum):
+        NEW = 0
+        SWEET = 1
+        SOUR = 2
+
+    monkeypatch.setattr(sys.modules[Taste.__module__], 'Taste', Taste2)
+    assert pickle.loads(data) is Taste2.SOUR
+
+
+@pytest.mark.django_db
+def test_pickle_model_instance():
+    instance = MyModel.objects.create(color=Color.RED, taste=Taste.UMAMI)
+    instance = pickle.loads(pickle.dumps(instance))
+    assert instance.color is Color.RED
+    assert instance.taste is Taste.UMAMI
+
+
+def test_members_where():
+    assert StateFlow.members_where(initial=False) == (StateFlow.PROCESSING, StateFlow.END)
+    assert StateFlow.members_where(initial=False, next=frozenset()) == (StateFlow.END,)
+    assert SubIntegerEnum.members_where(parents=IntegerEnum.B) == (SubIntegerEnum.C, SubIntegerEnum.D)
+    assert SubIntegerEnum.members_where(parents=IntegerEnum.C) == ()
+    assert StateFlow.get_attribute_index('initial') is StateFlow.get_attribute_index('initial')
+    with pytest.raises(ValueError):
+        StateFlow.members_where(typo='x')
+
+
+@pytest.mark.django_db
+def test_meta_lookup():
+    start = MyModel.objects.create(color=Color.RED, int_enum=IntegerEnum.A, sub_int_enum=SubIntegerEnum.C)
+    end = MyModel.objects.create(color=Color.RED, state=StateFlow.END, int_enum=IntegerEnum.B)
+
+    assert list(MyModel.objects.filter(state__meta_initial=False)) == [end]
+    assert list(MyModel.objects.filter(sub_int_enum__meta_parents=IntegerEnum.A)) == [start]
+    assert list(MyModel.objects.filter(sub_int_enum__meta_parents=IntegerEnum.C)) == []
+    with pytest.raises(FieldError):
+        MyModel.objects.filter(state__meta_typo='x')
+
+
+def test_localized_labels_cache(settings):
+    from django.utils import translation
+
+    from enumfields.enums import LABEL_CACHE
+
+    assert str(Color.BLUE) == 'bluë'
+    assert Color.localized_choices == [('r', 'Reddish'), ('g', 'Green'), ('b', 'bluë')]
+    assert Color.localized_labels == ['Reddish', 'Green', 'bluë']
+    assert all(isinstance(label, str) for label in Color.localized_labels)
+    assert (Color, translation.get_language()) in LABEL_CACHE
+    assert not Taste._has_lazy_labels_
+
+    with translation.override('fi'):
+        assert str(Color.BLUE) == 'bluë'
+        assert (Color, 'fi') in LABEL_CACHE
+
+    settings.LANGUAGES = [('en', 'English')]
+    assert not LABEL_CACHE
+
+
+def test_from_records():
+    Codes = TextChoicesEnum.from_records('Codes', [
+        ('FI', 'fi', 'Finland', {'regions': ['north', 'south']}),
+        ('SE', 'se', 'Sweden'),
+        ('NO_LABEL', 'nl'),
+    ])
+    assert Codes.__module__ == __name__
+    assert Codes.choices == [('fi', 'Finland'), ('se', 'Sweden'), ('nl', 'No Label')]
+    assert Codes('fi') is Codes.FI
+    assert Codes.FI.regions == ('north', 'south')
+    assert Codes.SE.regions is None
+    assert Codes.SE.next is None and Codes.SE.initial is True
+    assert Codes.members_where(regions='north') == (Codes.FI,)
+    assert construct_enum(deconstruct_enum(Codes)).values == Codes.values
+
+    with pytest.raises(ValueError):
+        TextChoicesEnum.from_records('Duplicates', [('A', 'a'), ('B', 'a')])
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+from django.core.serializers.base import DeserializationError
+
+from enumfields import fixtures
+
+from .enums import Color, IntegerEnum, Taste
+from .models import MyModel
+
+
+def test_enum_jsonl_round_trip():
+    instances = [
+        MyModel(pk=1, color=Color.RED, taste=Taste.SALTY, int_enum=IntegerEnum.A, tastes={Taste.SOUR, Taste.SWEET}),
+        MyModel(pk=2, color=Color.BLUE, taste=Taste.UMAMI),
+    ]
+    data = fixtures.Serializer().serialize(instances)
+    first = json.loads(data.splitlines()[0])['fields']
+    assert (first['color'], first['taste'], first['int_enum']) == ('RED', 'SALTY', 'A')
+    assert first['tastes'] == ['SOUR', 'SWEET']
+
+    objects = [deserialized.object for deserialized in fixtures.Deserializer(data, batch_size=1)]
+    assert [(obj.pk, obj.color, obj.taste) for obj in objects] == [
+        (1, Color.RED, Taste.SALTY),
+        (2, Color.BLUE, Taste.UMAMI),
+    ]
+    assert objects[0].tastes == frozenset({Taste.SOUR, Taste.SWEET})
+
+
+def test_enum_jsonl_unknown_name():
+    line = json.dumps({'model': 'tests.mymodel', 'pk': 1, 'fields': {'color': 'PURPLE'}})
+    with pytest.raises(DeserializationError):
+        list(fixtures.Deserializer(line))
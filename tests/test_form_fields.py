@@ -2,9 +2,13 @@
 import django
 import pytest
 from django.db.models import BLANK_CHOICE_DASH
+from django.forms import BaseFormSet, Form, ModelForm, formset_factory
 from django.forms.models import modelform_factory, model_to_dict
 
-from .enums import Color, ZeroEnum
+from enumfields import CharEnumField
+from enumfields.forms import EnumFormSetMixin, EnumTransitionModelFormMixin
+
+from .enums import Color, IntegerEnum, StateFlow, ZeroEnum
 from .models import MyModel
 
 
@@ -47,3 +51,67 @@ def test_validation():
     data = model_to_dict(instance, fields=("color", "zero2", "int_enum"))
     form = get_form(data=data)
     assert form.is_valid(), form.errors
+
+
+def test_choices_are_cached():
+    field = MyModel._meta.get_field('int_enum')
+    choices = field.get_choices()
+    assert choices == BLANK_CHOICE_DASH + [(0, 'foo'), (1, 'B'), (2, 'C')]
+    choices.append((42, 'bar'))
+    assert field.get_choices() == BLANK_CHOICE_DASH + [(0, 'foo'), (1, 'B'), (2, 'C')]
+    assert field.get_choices(include_blank=False) == [(0, 'foo'), (1, 'B'), (2, 'C')]
+
+
+def test_valid_value():
+    form_field = get_form().base_fields["int_enum"]
+    assert form_field.valid_value(IntegerEnum.B)
+    assert form_field.valid_value('2')
+    assert form_field.valid_value(0)
+    assert not form_field.valid_value('42')
+
+    form_field.choices = [(3, 'D')]
+    assert form_field.valid_value(3)
+    assert not form_field.valid_value(IntegerEnum.B)
+
+
+class EnumFormSet(EnumFormSetMixin, BaseFormSet):
+    pass
+
+
+def test_formset_bulk_clean():
+    FormSet = formset_factory(
+        type('ColorForm', (Form,), {'color': CharEnumField(Color).formfield()}), formset=EnumFormSet, extra=0
+    )
+    data = {'form-TOTAL_FORMS': '4', 'form-INITIAL_FORMS': '0'}
+    data.update({'form-{}-color'.format(i): value for i, value in enumerate(('r', 'g', 'r', 'x'))})
+    formset = FormSet(data=data)
+
+    assert not formset.is_valid()
+    assert [form.cleaned_data.get('color') for form in formset] == [Color.RED, Color.GREEN, Color.RED, None]
+    assert [bool(form.errors) for form in formset] == [False, False, False, True]
+    assert len(formset.forms[0].fields['color'].clean_cache) == 2
+
+
+class StateForm(EnumTransitionModelFormMixin, ModelForm):
+
+    class Meta:
+        model = MyModel
+        fields = ('color', 'state', 'any_first_state', 'int_enum')
+
+
+@pytest.mark.django_db
+def test_transition_choices():
+    assert [value for value, _ in StateForm().fields['state'].choices] == [4, 5, 6]
+
+    instance = MyModel.objects.create(color=Color.RED)
+    form = StateForm(instance=instance)
+    assert form.fields['state'].choices == [(4, 'start'), (5, 'processing')]
+    assert form.fields['int_enum'].choices == BLANK_CHOICE_DASH + [(0, 'foo'), (1, 'B'), (2, 'C')]
+
+    instance.state = StateFlow.PROCESSING
+    instance.save()
+    assert StateForm(instance=instance).fields['state'].choices == [(5, 'processing'), (6, 'end')]
+
+    form = StateForm(instance=instance, data={'color': 'r', 'state': '4', 'any_first_state': '0'})
+    assert not form.is_valid()
+    assert 'state' in form.errors
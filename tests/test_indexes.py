@@ -0,0 +1,40 @@
+from django.db import connection, models
+from django.db.migrations.state import ModelState
+
+from enumfields.indexes import EnumPartialIndex, get_non_terminal_members
+
+from .enums import StateFlow
+from .models import MyModel
+
+
+def test_non_terminal_members():
+    assert get_non_terminal_members(StateFlow) == [StateFlow.START, StateFlow.PROCESSING]
+
+
+def test_enum_partial_index():
+    index = EnumPartialIndex('state', StateFlow, name='active_state_idx')
+    path, args, kwargs = index.deconstruct()
+    assert path == 'django.db.models.Index'
+    assert kwargs == {
+        'fields': ['state'],
+        'name': 'active_state_idx',
+        'condition': models.Q(state__in=[4, 5]),
+    }
+
+    index = EnumPartialIndex('state', 'tests.enums.StateFlow', [StateFlow.END], fields=['state', 'id'], name='idx')
+    assert index.fields == ['state', 'id']
+    assert index.condition == models.Q(state__in=[6])
+
+
+def test_enum_partial_index_sql():
+    index = EnumPartialIndex('state', StateFlow, name='active_state_idx')
+    sql = str(index.create_sql(MyModel, connection.schema_editor()))
+    assert 'WHERE' in sql
+    assert 'IN (4, 5)' in sql
+
+
+def test_enum_partial_index_in_model_meta():
+    index, = ModelState.from_model(MyModel).options['indexes']
+    assert type(index) is models.Index
+    assert index.name == 'mymodel_active_state_idx'
+    assert index.condition == models.Q(state__in=[4, 5])
@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from enumfields.json import EnumJSONEncoder, enum_dec_hook, enum_default
+
+from .enums import Color, Taste
+
+
+def test_json_encoder():
+    data = {'color': Color.BLUE, 'taste': Taste.UMAMI, 'tastes': [Taste.SWEET]}
+    assert json.loads(json.dumps(data, cls=EnumJSONEncoder)) == {'color': 'b', 'taste': 5, 'tastes': [1]}
+
+
+def test_enum_default():
+    assert enum_default(Color.RED) == 'r'
+    with pytest.raises(TypeError):
+        enum_default(object())
+
+
+def test_orjson_default():
+    orjson = pytest.importorskip('orjson')
+    assert orjson.loads(orjson.dumps({'color': Color.RED}, default=enum_default)) == {'color': 'r'}
+
+
+def test_enum_dec_hook():
+    assert enum_dec_hook(Taste, 5) is Taste.UMAMI
+    assert enum_dec_hook(Color, 'g') is Color.GREEN
+    with pytest.raises(ValueError):
+        enum_dec_hook(Color, 'x')
+    with pytest.raises(NotImplementedError):
+        enum_dec_hook(dict, {})
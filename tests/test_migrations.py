@@ -0,0 +1,74 @@
+from django.db import connection, models
+from django.db.migrations.autodetector import MigrationAutodetector
+from django.db.migrations.state import ModelState, ProjectState
+
+from enumfields import CharEnumField, Choice, TextChoicesEnum
+from enumfields.autodetector import EnumMigrationAutodetector
+from enumfields.fields import enum_fingerprint
+
+from .enums import Color
+
+
+class RelabeledColor(TextChoicesEnum):
+    BLUE = Choice('b', 'Blue', next={'RED'})
+    RED = Choice('r', 'Red')
+    GREEN = Choice('g', 'Green', initial=False)
+
+
+class ExtendedColor(TextChoicesEnum):
+    RED = 'r'
+    GREEN = 'g'
+    BLUE = 'b'
+    YELLOW = 'y'
+
+
+def get_state(enum):
+    state = ProjectState()
+    state.add_model(ModelState('tests', 'Paint', [('color', CharEnumField(enum, max_length=1))]))
+    return state
+
+
+def get_changes(autodetector_cls, from_enum, to_enum):
+    return autodetector_cls(get_state(from_enum), get_state(to_enum))._detect_changes()
+
+
+def test_enum_fingerprint():
+    assert enum_fingerprint(Color) == enum_fingerprint(RelabeledColor)
+    assert enum_fingerprint(Color) != enum_fingerprint(ExtendedColor)
+
+
+def test_autodetector_ignores_python_side_changes():
+    assert get_changes(MigrationAutodetector, Color, RelabeledColor)
+    assert not get_changes(EnumMigrationAutodetector, Color, RelabeledColor)
+
+    changes = get_changes(EnumMigrationAutodetector, Color, ExtendedColor)
+    assert [operation.__class__.__name__ for operation in changes['tests'][0].operations] == ['AlterField']
+
+
+def test_enum_change_does_not_alter_column():
+    old_field, new_field = CharEnumField(Color, max_length=1), CharEnumField(ExtendedColor, max_length=1)
+    old_field.set_attributes_from_name('color')
+    new_field.set_attributes_from_name('color')
+    assert not connection.schema_editor()._field_should_be_altered(old_field, new_field)
+
+
+class ThirdPartyField(models.CharField):
+
+    def __init__(self, *args, enum=None, **kwargs):
+        self.enum_name = enum
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['enum'] = self.enum_name
+        return name, path, args, kwargs
+
+
+def test_autodetector_ignores_other_fields_with_enum_kwarg():
+    def get_third_party_state(enum_name):
+        state = ProjectState()
+        state.add_model(ModelState('tests', 'Paint', [('kind', ThirdPartyField(max_length=1, enum=enum_name))]))
+        return state
+
+    changes = EnumMigrationAutodetector(get_third_party_state('a'), get_third_party_state('b'))._detect_changes()
+    assert [op.__class__.__name__ for op in changes['tests'][0].operations] == ['AlterField']
@@ -0,0 +1,86 @@
+import pytest
+from django.apps import apps
+from django.db import connection
+from django.db.migrations.state import ProjectState
+
+from enumfields import Choice, IntegerChoicesEnum
+from enumfields.operations import RemapEnumValues, RenameEnumValue, get_enum_value_mapping
+
+from .enums import Color, Taste
+from .models import MyModel
+
+
+def get_stored_values(field_name):
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT {} FROM {} ORDER BY id'.format(field_name, MyModel._meta.db_table))
+        return [row[0] for row in cursor.fetchall()]
+
+
+def test_get_enum_value_mapping():
+    class NewTaste(IntegerChoicesEnum):
+        SWEET = Choice(10, 'sweet')
+        SOUR = 2
+        SPICY = 6
+
+    assert get_enum_value_mapping(Taste, NewTaste) == {1: 10}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_remap_enum_values():
+    for taste in (Taste.SWEET, Taste.SOUR, Taste.SWEET, Taste.BITTER, Taste.SWEET):
+        MyModel.objects.create(color=Color.RED, taste=taste)
+
+    state = ProjectState.from_apps(apps)
+    progress = []
+    operation = RemapEnumValues('MyModel', 'taste', {1: 2, 2: 3}, batch_size=2, progress_callback=progress.append)
+    with connection.schema_editor() as editor:
+        operation.database_forwards('tests', editor, state, state)
+    assert get_stored_values('taste') == [2, 3, 2, 3, 2]
+    assert progress == [2, 4]
+
+    operation = RemapEnumValues('MyModel', 'taste', {2: 5})
+    with connection.schema_editor() as editor:
+        operation.database_forwards('tests', editor, state, state)
+    assert get_stored_values('taste') == [5, 3, 5, 3, 5]
+    with connection.schema_editor() as editor:
+        operation.database_backwards('tests', editor, state, state)
+    assert get_stored_values('taste') == [2, 3, 2, 3, 2]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rename_enum_value():
+    MyModel.objects.create(color=Color.RED)
+    MyModel.objects.create(color=Color.GREEN)
+
+    state = ProjectState.from_apps(apps)
+    operation = RenameEnumValue('MyModel', 'color', 'r', 'x')
+    with connection.schema_editor() as editor:
+        operation.database_forwards('tests', editor, state, state)
+    assert get_stored_values('color') == ['x', 'g']
+    assert operation.deconstruct() == ('RenameEnumValue', ('MyModel', 'color', 'r', 'x'), {})
+    assert not RemapEnumValues('MyModel', 'color', {'r': 'g', 'b': 'g'}).reversible
+
+
+@pytest.mark.django_db(transaction=True)
+def test_remap_enum_values_rerun_after_interruption():
+    for taste in (Taste.SWEET, Taste.SOUR, Taste.SWEET, Taste.BITTER, Taste.SWEET):
+        MyModel.objects.create(color=Color.RED, taste=taste)
+
+    def interrupt(remapped):
+        raise KeyboardInterrupt
+
+    state = ProjectState.from_apps(apps)
+    operation = RemapEnumValues('MyModel', 'taste', {1: 10, 2: 20}, batch_size=2, progress_callback=interrupt)
+    with pytest.raises(KeyboardInterrupt), connection.schema_editor(atomic=False) as editor:
+        operation.database_forwards('tests', editor, state, state)
+    assert get_stored_values('taste') == [10, 20, 1, 3, 1]
+
+    operation = RemapEnumValues('MyModel', 'taste', {1: 10, 2: 20}, batch_size=2)
+    with connection.schema_editor(atomic=False) as editor:
+        operation.database_forwards('tests', editor, state, state)
+    assert get_stored_values('taste') == [10, 20, 10, 3, 10]
+
+    operation = RemapEnumValues('MyModel', 'taste', {10: 20, 20: 30})
+    with pytest.raises(ValueError), connection.schema_editor(atomic=False) as editor:
+        operation.database_forwards('tests', editor, state, state)
+    assert get_stored_values('taste') == [10, 20, 10, 3, 10]
@@ -0,0 +1,25 @@
+import pytest
+
+from enumfields.fields import deconstruct_enum
+
+from .enums import Color, Taste
+
+postgres = pytest.importorskip('enumfields.postgres')
+
+
+def test_enum_array_field_conversion():
+    field = postgres.EnumArrayField(Taste)
+    assert field.from_db_value([1, 5], None, None) == [Taste.SWEET, Taste.UMAMI]
+    assert field.get_db_prep_value([Taste.SOUR, '3'], None) == [2, 3]
+    assert postgres.EnumArrayField(Color).to_python('["r", "b"]') == [Color.RED, Color.BLUE]
+
+
+def test_enum_array_field_deconstruct():
+    _, _, _, kwargs = postgres.EnumArrayField('tests.enums.Color', size=3).deconstruct()
+    assert kwargs['enum'] == deconstruct_enum(Color)
+    assert kwargs['size'] == 3
+
+
+def test_enum_array_field_formfield():
+    form_field = postgres.EnumArrayField(Taste).formfield()
+    assert form_field.clean(['1', '5']) == [Taste.SWEET, Taste.UMAMI]
@@ -1,10 +1,13 @@
 # -- encoding: UTF-8 --
 
+import copy
 import uuid
 
 import pytest
 from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
 
+from enumfields.drf.fields import EnumField as EnumSerializerField, EnumMultipleField, get_lenient_index
 from enumfields.drf.serializers import EnumSupportSerializerMixin
 
 from .enums import Color, IntegerEnum, Taste
@@ -75,3 +78,99 @@ def test_deserialize(lenient_data, lenient_serializer):
     assert inst.color == Color.BLUE
     assert inst.taste == Taste.UMAMI
     assert inst.int_enum == IntegerEnum.B
+
+
+def test_lenient_lookup():
+    field = EnumSerializerField(Taste, lenient=True)
+    assert field.to_internal_value('UMAMI') is Taste.UMAMI
+    assert field.to_internal_value('uMaMi') is Taste.UMAMI
+    assert field.to_internal_value(5) is Taste.UMAMI
+    assert field.to_internal_value('5') is Taste.UMAMI
+    with pytest.raises(ValidationError):
+        field.to_internal_value(['umami'])
+    with pytest.raises(ValidationError):
+        field.to_internal_value('bitter-sweet')
+
+
+def test_lenient_index_is_shared():
+    assert get_lenient_index(Taste) is get_lenient_index(Taste)
+    assert get_lenient_index(Taste)[1]['sweet'] is Taste.SWEET
+
+
+def test_choices_are_shared():
+    field = EnumSerializerField(Color)
+    field_copy = copy.deepcopy(field)
+    assert field_copy.choice_strings_to_values is field.choice_strings_to_values
+    assert field_copy.grouped_choices is field.grouped_choices
+    assert list(field.choices) == ['r', 'g', 'b']
+    assert field.to_internal_value('g') is Color.GREEN
+    assert [option.value for option in field.iter_options()] == ['r', 'g', 'b']
+
+
+class CustomRepresentationSerializer(MySerializer):
+    def to_representation(self, instance):
+        ret = super().to_representation(instance)
+        ret['custom'] = True
+        return ret
+
+
+@pytest.mark.parametrize('int_names', (False, True))
+def test_serialize_many(int_names):
+    serializer_cls = LenientIntNameSerializer if int_names else MySerializer
+    instances = [
+        MyModel(color=Color.BLUE, taste=Taste.UMAMI, int_enum=IntegerEnum.B),
+        MyModel(color=Color.RED, taste=Taste.SOUR),
+    ]
+    serializer = serializer_cls(instances, many=True)
+    assert serializer.data == [serializer_cls(instance).data for instance in instances]
+
+
+def test_serialize_many_custom_to_representation():
+    instances = [MyModel(color=Color.BLUE), MyModel(color=Color.RED)]
+    data = CustomRepresentationSerializer(instances, many=True).data
+    assert [(row['color'], row['custom']) for row in data] == [('b', True), ('r', True)]
+
+
+def test_to_representation_many():
+    field = EnumSerializerField(Taste, ints_as_names=True)
+    assert field.to_representation_many([Taste.SOUR, 5, None]) == ['sour', 'umami', None]
+
+
+def test_enum_multiple_field():
+    field = EnumMultipleField(Taste)
+    assert field.to_internal_value(['1', Taste.SOUR, 5, '1']) == [Taste.SWEET, Taste.SOUR, Taste.UMAMI]
+    assert field.to_representation([Taste.SWEET, Taste.SWEET, Taste.UMAMI]) == [1, 5]
+
+    with pytest.raises(ValidationError) as ex:
+        field.to_internal_value(['1', 'foo', 2, 42])
+    assert set(ex.value.detail) == {1, 3}
+
+    with pytest.raises(ValidationError):
+        field.to_internal_value('1')
+    with pytest.raises(ValidationError):
+        EnumMultipleField(Taste, allow_empty=False).to_internal_value([])
+
+
+def test_enum_multiple_field_output():
+    data = ['sweet', 'BITTER', 'sweet']
+    assert EnumMultipleField(Taste, lenient=True, output='frozenset').to_internal_value(data) == frozenset(
+        {Taste.SWEET, Taste.BITTER}
+    )
+    field = EnumMultipleField(Taste, lenient=True, ints_as_names=True, output='bitmask')
+    assert field.to_internal_value(data) == 0b101
+    assert field.to_representation(0b101) == ['sweet', 'bitter']
+
+
+@pytest.mark.django_db
+def test_enum_set_field():
+    inst = MyModel.objects.create(color=Color.BLUE, tastes={Taste.SOUR})
+    assert MySerializer(inst).data['tastes'] == [Taste.SOUR.value]
+
+    serializer = MySerializer(inst, data={'tastes': [1, '2', 1]}, partial=True)
+    assert serializer.is_valid(), serializer.errors
+    assert serializer.validated_data['tastes'] == frozenset({Taste.SWEET, Taste.SOUR})
+    assert serializer.save().tastes == frozenset({Taste.SWEET, Taste.SOUR})
+
+    serializer = MySerializer(inst, data={'tastes': [1, 42]}, partial=True)
+    assert not serializer.is_valid()
+    assert set(serializer.errors['tastes']) == {1}
@@ -0,0 +1,89 @@
+from datetime import timedelta
+
+import pytest
+from django.db import transaction
+
+from enumfields.transitions import TransitionRecorder
+
+from .enums import Color, StateFlow
+from .models import MyModel, StateTransition
+
+
+@pytest.fixture
+def recorder():
+    recorder = TransitionRecorder(StateTransition)
+    recorder.register(MyModel, 'state', 'any_first_state')
+    yield recorder
+    recorder.unregister(MyModel)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_transitions_are_recorded_on_commit(recorder):
+    with transaction.atomic():
+        model = MyModel.objects.create(color=Color.RED)
+        model.state = StateFlow.PROCESSING
+        model.save()
+        model.color = Color.BLUE
+        model.save()
+        assert not StateTransition.objects.exists()
+
+    transitions = StateTransition.objects.for_instance(model, 'state').order_by('pk')
+    assert [(t.from_value, t.to_value) for t in transitions] == [(None, '4'), ('4', '5')]
+    assert StateTransition.objects.for_instance(model, 'any_first_state').count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_transitions_in_rolled_back_savepoint(recorder):
+    with transaction.atomic():
+        model = MyModel.objects.create(color=Color.RED)
+        with pytest.raises(RuntimeError), transaction.atomic():
+            model.state = StateFlow.PROCESSING
+            model.save()
+            raise RuntimeError
+
+    transitions = StateTransition.objects.for_instance(model, 'state')
+    assert [(t.from_value, t.to_value) for t in transitions] == [(None, '4')]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rolled_back_transitions_are_not_recorded(recorder):
+    model = MyModel.objects.create(color=Color.RED)
+    recorder.flush()
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            model.state = StateFlow.PROCESSING
+            model.save()
+            raise RuntimeError
+    recorder.flush()
+    assert StateTransition.objects.for_instance(model, 'state').count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_transitions_are_buffered_outside_transactions(recorder):
+    recorder.batch_size = 3
+    model = MyModel.objects.create(color=Color.RED)
+    assert not StateTransition.objects.exists()
+    model.state = StateFlow.PROCESSING
+    model.save()
+    assert StateTransition.objects.count() == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_time_in_states(recorder):
+    model = MyModel.objects.create(color=Color.RED)
+    model.state = StateFlow.PROCESSING
+    model.save()
+    recorder.flush()
+
+    start, processing = StateTransition.objects.for_instance(model, 'state').order_by('pk')
+    StateTransition.objects.filter(pk=start.pk).update(created_at=processing.created_at - timedelta(minutes=5))
+
+    durations = StateTransition.objects.for_instance(model, 'state').time_in_states(
+        now=processing.created_at + timedelta(minutes=1)
+    )
+    assert durations == {'4': timedelta(minutes=5), '5': timedelta(minutes=1)}
+
+
+def test_register_requires_transitions():
+    with pytest.raises(ValueError):
+        TransitionRecorder(StateTransition).register(MyModel, 'color')